@@ -0,0 +1,194 @@
+import argparse
+import contextlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Offline benchmark for the date parsing and status hot paths of ombicheck.py.
+# Needs no network: all input is a synthetic corpus generated from a fixed seed.
+#
+#   python benchmark.py                      # run with the default corpus
+#   python benchmark.py --json base.json     # save the numbers
+#   python benchmark.py --compare base.json  # flag functions that got slower
+
+import dateparse
+import ombicheck
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+TITLE_WORDS = ["The", "Last", "Night", "Superman", "Jurassic", "World", "Rebirth", "Years",
+               "Later", "Movie", "Return", "Dark", "City", "Of", "Dreams", "Lost", "Kingdom",
+               "Star", "Wars", "F1", "Mission", "Final", "Chapter", "Part", "Two"]
+JUNK = ["", "TBD", "Coming soon", "Streaming", "In Theaters", "Digital release date", "N/A", "—"]
+
+def random_date_string(rng):
+    """A date string in one of the formats Vuniper and digital_dates.txt use, or junk."""
+    year = rng.randint(1990, 2030)
+    month = rng.randint(1, 12)
+    day = rng.randint(1, 28)
+    name = MONTHS[month - 1]
+    formats = [
+        f"{name[:3]} {day}, {year}",
+        f"{name} {day}, {year}",
+        f"{name[:3]} {day} {year}",
+        f"{day} {name[:3]} {year}",
+        f"{month}/{day}/{year}",
+        f"{year}-{month:02d}-{day:02d}",
+        f"{day:02d}-{month:02d}-{year}",
+        f"{name[:3]} {year}",
+        f"{name} {year}",
+        f"{year}",
+        rng.choice(JUNK),
+    ]
+    return rng.choice(formats)
+
+def random_title(rng):
+    return " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(1, 4)))
+
+def random_text(rng):
+    """A longer text with a date somewhere in it, for extract_date_from_text()."""
+    return f"{random_title(rng)} {rng.choice(JUNK)} {random_date_string(rng)} {rng.choice(JUNK)}"
+
+def iso_or_tbd(rng):
+    if rng.random() < 0.2:
+        return "TBD"
+    return f"{rng.randint(2015, 2030)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+def build_corpus(size, seed):
+    rng = random.Random(seed)
+    statuses = ["Yes", "Soon", "TBD", "No", None]
+    status_args = []
+    for _ in range(size):
+        status = rng.choice(statuses)
+        release_info = {'status': status} if status else None
+        status_args.append((release_info, iso_or_tbd(rng), iso_or_tbd(rng)))
+
+    custom_lines = ["# Custom digital release dates"]
+    for _ in range(max(size // 20, 10)):
+        month = rng.choice(MONTHS)
+        day = rng.randint(1, 28)
+        custom_lines.append(rng.choice([
+            f"{random_title(rng)} {month} {day}",
+            f"{random_title(rng)} {day} {month.lower()}",
+            f"{random_title(rng)} {month[:3]} {day}, {rng.randint(2024, 2027)}",
+            f"{random_title(rng)} {month} {day} {rng.randint(2024, 2027)}",
+        ]))
+
+    return {
+        'dates': [random_date_string(rng) for _ in range(size)],
+        'texts': [random_text(rng) for _ in range(size)],
+        'status_args': status_args,
+        'custom_lines': custom_lines,
+    }
+
+def bench(name, func, inputs, repeat):
+    """Time func over all inputs (best of repeat) and measure memory with tracemalloc."""
+    best = None
+    # The functions print debug output, keep it out of the table
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for item in inputs:
+                func(item)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+
+        tracemalloc.start()
+        blocks_before = sys.getallocatedblocks()
+        for item in inputs:
+            func(item)
+        blocks_after = sys.getallocatedblocks()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    ops = len(inputs) / best if best else float('inf')
+    return {
+        'name': name,
+        'calls': len(inputs),
+        'ops_per_sec': ops,
+        'us_per_call': best / len(inputs) * 1e6,
+        'peak_kib': peak / 1024,
+        'retained_blocks': blocks_after - blocks_before,
+    }
+
+def run(size, seed, repeat, only=None):
+    corpus = build_corpus(size, seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dates_file = os.path.join(tmp, "digital_dates.txt")
+        with open(dates_file, "w", encoding="utf-8") as f:
+            f.write("\n".join(corpus['custom_lines']))
+
+        cases = [
+            ("standardize_date", ombicheck.standardize_date, corpus['dates']),
+            # The same parser without its memo, the cost of a date string seen for the first time
+            ("parse_date_uncached", dateparse.parse_date_uncached, corpus['dates']),
+            ("extract_date_from_text", ombicheck.extract_date_from_text, corpus['texts']),
+            ("determine_downloadable_status", lambda args: ombicheck.determine_downloadable_status(*args),
+             corpus['status_args']),
+            # One call parses the whole file, so fewer calls
+            ("load_custom_digital_dates", ombicheck.load_custom_digital_dates,
+             [dates_file] * max(size // 1000, 5)),
+        ]
+
+        results = []
+        for name, func, inputs in cases:
+            if only and name not in only:
+                continue
+            results.append(bench(name, func, inputs, repeat))
+        return results
+
+def print_table(results, baseline=None, threshold=0.10):
+    """Print the results. Returns the names that are slower than the baseline by more than threshold."""
+    header = f"{'Function':<32} {'Calls':>8} {'ops/sec':>12} {'us/call':>10} {'peak KiB':>10} {'blocks':>8}"
+    print(header)
+    print("-" * len(header))
+    regressions = []
+    for r in results:
+        line = (f"{r['name']:<32} {r['calls']:>8} {r['ops_per_sec']:>12,.0f} {r['us_per_call']:>10.2f} "
+                f"{r['peak_kib']:>10.1f} {r['retained_blocks']:>8}")
+        base = (baseline or {}).get(r['name'])
+        if base:
+            change = r['ops_per_sec'] / base['ops_per_sec'] - 1
+            line += f"  {change:+.1%}"
+            if change < -threshold:
+                line += "  REGRESSION"
+                regressions.append(r['name'])
+        print(line)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the date parsing and classification hot paths")
+    parser.add_argument("--size", type=int, default=20000, help="Number of synthetic inputs per function")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per function (best one counts)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the synthetic corpus")
+    parser.add_argument("--only", nargs="+", help="Only run these functions")
+    parser.add_argument("--json", help="Save the results to this JSON file")
+    parser.add_argument("--compare", help="Compare against results saved earlier with --json")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Slowdown that counts as a regression")
+    args = parser.parse_args()
+
+    results = run(args.size, args.seed, args.repeat, args.only)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = {r['name']: r for r in json.load(f)['results']}
+
+    print(f"Corpus: {args.size} inputs, seed {args.seed}, best of {args.repeat}\n")
+    regressions = print_table(results, baseline, args.threshold)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'size': args.size, 'seed': args.seed, 'results': results}, f, indent=2)
+
+    if regressions:
+        print(f"\nSlower than baseline: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import json
+import sqlite3
+import time
+from datetime import datetime
+
+DAY = 24 * 3600
+
+# When a request has to be checked again, based on its last status
+TBD_BACKOFF_START = 1 * DAY     # doubled after every TBD result in a row
+TBD_BACKOFF_MAX = 14 * DAY
+SOON_RECHECK = 7 * DAY          # dates may still shift before the digital release
+NO_RECHECK = 3 * DAY            # theater only, a digital date can appear any time
+YES_RECHECK = 30 * DAY          # available, nothing left to change
+
+class CheckState:
+    """Remembers when each Ombi request was last checked and with what result."""
+
+    def __init__(self, db_path="ombicheck_state.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS check_state (
+                request_id INTEGER PRIMARY KEY,
+                title TEXT NOT NULL,
+                last_checked REAL NOT NULL,
+                last_status TEXT,
+                digital_date TEXT,
+                tbd_streak INTEGER NOT NULL DEFAULT 0,
+                result TEXT
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, request_id):
+        row = self.conn.execute(
+            "SELECT title, last_checked, last_status, digital_date, tbd_streak, result "
+            "FROM check_state WHERE request_id = ?", (request_id,)
+        ).fetchone()
+        if not row:
+            return None
+        title, last_checked, last_status, digital_date, tbd_streak, result = row
+        return {
+            'title': title,
+            'last_checked': last_checked,
+            'last_status': last_status,
+            'digital_date': digital_date,
+            'tbd_streak': tbd_streak,
+            'result': json.loads(result) if result else None,
+        }
+
+    def due_reason(self, request, now=None):
+        """Why a request has to be checked now, or None when it cannot have changed."""
+        now = now or time.time()
+        state = self.get(request.request_id)
+        if not state or not state['result']:
+            return "new"
+        if state['title'] != request.title:
+            return "title changed"
+
+        age = now - state['last_checked']
+        status = state['last_status']
+
+        if status == 'Soon':
+            try:
+                if datetime.strptime(state['digital_date'], "%Y-%m-%d").timestamp() <= now:
+                    return "digital date passed"
+            except (TypeError, ValueError):
+                pass
+            return "recheck soon" if age >= SOON_RECHECK else None
+        if status == 'TBD':
+            backoff = min(TBD_BACKOFF_START * 2 ** max(state['tbd_streak'] - 1, 0), TBD_BACKOFF_MAX)
+            return "tbd backoff over" if age >= backoff else None
+        if status == 'No':
+            return "recheck no" if age >= NO_RECHECK else None
+        if status == 'Yes':
+            return "recheck yes" if age >= YES_RECHECK else None
+        return "unknown status"
+
+    def previous_result(self, request_id):
+        state = self.get(request_id)
+        return state['result'] if state else None
+
+    def record(self, request, result):
+        """Store the outcome of a check."""
+        previous = self.get(request.request_id)
+        tbd_streak = 0
+        if result.get('status') == 'TBD':
+            tbd_streak = (previous['tbd_streak'] if previous else 0) + 1
+
+        digital_date = result.get('digital_date')
+        self.conn.execute(
+            "INSERT OR REPLACE INTO check_state "
+            "(request_id, title, last_checked, last_status, digital_date, tbd_streak, result) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                request.request_id,
+                request.title,
+                time.time(),
+                result.get('status'),
+                digital_date if digital_date != "TBD" else None,
+                tbd_streak,
+                json.dumps(result),
+            )
+        )
+        self.conn.commit()
+
+    def forget_missing(self, request_ids):
+        """Drop requests that are no longer pending in Ombi."""
+        keep = set(request_ids)
+        stored = [row[0] for row in self.conn.execute("SELECT request_id FROM check_state")]
+        self.conn.executemany("DELETE FROM check_state WHERE request_id = ?",
+                              [(request_id,) for request_id in stored if request_id not in keep])
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,216 @@
+import os
+import re
+import threading
+from collections import Counter
+
+# Words that say nothing about which movie is meant
+STOP_WORDS = {"the", "a", "an", "and", "of", "&"}
+
+# Words that are often added to a title without making it another movie ("F1 The Movie")
+FILLER_WORDS = {"movie", "film"}
+
+# Minimum score for a fuzzy match. An extra word counts double, so a sequel
+# ("Superman II", "Jurassic World Dominion") stays below it for a short entry title.
+MIN_MATCH_SCORE = 0.6
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+MONTH_MAP = {
+    'january': '01', 'february': '02', 'march': '03', 'april': '04',
+    'may': '05', 'june': '06', 'july': '07', 'august': '08',
+    'september': '09', 'october': '10', 'november': '11', 'december': '12',
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'jun': '06', 'jul': '07', 'aug': '08',
+    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+
+def title_variations(title):
+    """Lowercase variations a title is stored and looked up under."""
+    title_lower = title.lower()
+    variations = [
+        title_lower,
+        title_lower.replace(":", ""),  # Remove colons
+        title_lower.replace(":", " "),  # Replace colons with spaces
+    ]
+    # Handle "The" prefix
+    if title_lower.startswith("the "):
+        variations.append(title_lower.replace("the ", "").strip())
+    else:
+        variations.append(f"the {title_lower}")
+    return variations
+
+def title_tokens(title):
+    """Normalized words of a title, without stop words (unless that leaves nothing)."""
+    tokens = TOKEN_PATTERN.findall(title.lower())
+    meaningful = [token for token in tokens if token not in STOP_WORDS]
+    return meaningful or tokens
+
+def match_words(tokens):
+    """The words that have to match, without filler words (unless that leaves nothing)."""
+    words = {token for token in tokens if token not in FILLER_WORDS}
+    return words or set(tokens)
+
+def match_score(query_words, entry_words):
+    """How well an entry title matches a title, 0 unless every word of the entry is in the title.
+
+    Each extra word of the title counts double against the score.
+    """
+    if not entry_words or not entry_words <= query_words:
+        return 0.0
+    extra = len(query_words - entry_words)
+    return len(entry_words) / (len(entry_words) + 2 * extra)
+
+class CustomDates(dict):
+    """Custom digital dates by title variation, with a word index for fuzzy lookups.
+
+    Works as the plain {variation: date} dict it used to be, plus best_match().
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.entries = []   # (title, match words, date)
+        self.index = {}     # token -> entry numbers
+
+    def add(self, title, date):
+        for variation in title_variations(title):
+            self[variation] = date
+
+        words = match_words(title_tokens(title))
+        entry = len(self.entries)
+        self.entries.append((title, words, date))
+        for token in words:
+            self.index.setdefault(token, []).append(entry)
+
+    def exact(self, title):
+        """Date for one of the stored variations of title, or None."""
+        for variation in title_variations(title):
+            if variation in self:
+                return self[variation]
+        return None
+
+    def candidates(self, tokens):
+        """Entry numbers sharing at least one word with tokens, with the number of shared words."""
+        shared = Counter()
+        for token in set(tokens):
+            shared.update(self.index.get(token, ()))
+        return shared
+
+    def best_match(self, title, min_score=MIN_MATCH_SCORE):
+        """Best fuzzy match for title as (entry title, date, score), or None.
+
+        Only entries sharing a word with title are scored, see match_score. On equal
+        scores the longer (more specific) entry title wins.
+        """
+        query_words = match_words(title_tokens(title))
+        if not query_words:
+            return None
+
+        best = None
+        best_size = 0
+        for entry in self.candidates(query_words):
+            entry_title, entry_words, date = self.entries[entry]
+            score = match_score(query_words, entry_words)
+            if score < min_score:
+                continue
+            if best is None or (score, len(entry_words)) > (best[2], best_size):
+                best = (entry_title, date, score)
+                best_size = len(entry_words)
+        return best
+
+def parse_custom_dates_line(line):
+    """Parse one digital_dates.txt line into (title, YYYY-MM-DD), or None if it is not valid.
+
+    Formats: "Movie Title MONTH DAY", "Movie Title DAY MONTH" (assume 2025),
+    "Movie Title Month Day Year" and "Movie Title Month Day, Year".
+    """
+    # Handle comma-separated year first
+    if ',' in line:
+        parts_before_comma = line.split(',')[0].strip().split()
+        year_str = line.split(',')[1].strip()
+        if len(parts_before_comma) < 3:
+            return None
+        title = ' '.join(parts_before_comma[:-2]).strip()
+        month_str = parts_before_comma[-2]
+        day_str = parts_before_comma[-1]
+    else:
+        parts = line.split()
+        if len(parts) < 3:
+            return None
+        if len(parts) >= 4 and parts[-1].isdigit() and len(parts[-1]) == 4:
+            # "Movie Title Month Day Year"
+            title = ' '.join(parts[:-3]).strip()
+            month_str, day_str, year_str = parts[-3], parts[-2], parts[-1]
+        elif parts[-2].isdigit():
+            # "Movie Title DAY MONTH"
+            title = ' '.join(parts[:-2]).strip()
+            day_str, month_str, year_str = parts[-2], parts[-1], "2025"
+        else:
+            # "Movie Title MONTH DAY"
+            title = ' '.join(parts[:-2]).strip()
+            month_str, day_str, year_str = parts[-2], parts[-1], "2025"
+
+    month_num = MONTH_MAP.get(month_str.lower())
+    if not month_num or not day_str.isdigit():
+        return None
+    return title, f"{year_str}-{month_num}-{day_str.zfill(2)}"
+
+def load_custom_dates(dates_file):
+    """Read digital_dates.txt into a CustomDates index."""
+    custom_dates = CustomDates()
+    with open(dates_file, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):  # Skip empty lines and comments
+                continue
+            parsed = parse_custom_dates_line(line)
+            if parsed:
+                custom_dates.add(*parsed)
+            else:
+                print(f"Warning: Could not parse line {line_num}: {line}")
+    return custom_dates
+
+class CustomDatesStore:
+    """One digital_dates.txt per process, parsed again only when the file changes on disk."""
+
+    def __init__(self, dates_file):
+        self.dates_file = dates_file
+        self.lock = threading.Lock()
+        self.signature = None
+        self.custom_dates = CustomDates()
+
+    def set_path(self, dates_file):
+        with self.lock:
+            if dates_file != self.dates_file:
+                self.dates_file = dates_file
+                self.signature = None
+
+    def file_signature(self):
+        try:
+            stat = os.stat(self.dates_file)
+        except OSError:
+            return "missing"
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self):
+        """The current custom dates; costs one stat() call when the file did not change."""
+        with self.lock:
+            signature = self.file_signature()
+            if signature == self.signature:
+                return self.custom_dates
+
+            self.signature = signature
+            if signature == "missing":
+                self.custom_dates = CustomDates()
+                print(f"No digital_dates.txt file found at {self.dates_file}.")
+                print("Format examples:")
+                print("'Movie Title Month Day' -> 'F1 August 26'")
+                print("'Movie Title Day Month' -> '28 Years Later 30 july'")
+                print("'Movie Title Month Day, Year' -> 'Superman August 26, 2025'")
+                return self.custom_dates
+
+            try:
+                self.custom_dates = load_custom_dates(self.dates_file)
+                print(f"Loaded {len(self.custom_dates.entries)} custom dates from {self.dates_file}")
+            except Exception as e:
+                print(f"Error loading custom digital dates: {str(e)}")
+            return self.custom_dates
@@ -0,0 +1,84 @@
+import re
+from datetime import date
+from functools import lru_cache
+
+# Month names as accepted by strptime's %b (3 letters) and %B (full name)
+MONTH_ABBR = {name: i for i, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], 1)}
+MONTH_FULL = {name: i for i, name in enumerate(
+    ['january', 'february', 'march', 'april', 'may', 'june', 'july', 'august',
+     'september', 'october', 'november', 'december'], 1)}
+
+# How ambiguous numeric dates are read when no day_first is given:
+# "1/15/2025" is month-first, "15-01-2025" is day-first.
+SLASH_DAY_FIRST = False
+DASH_DAY_FIRST = True
+
+# All supported formats in one pattern, matched once against the whole string
+DATE_PATTERN = re.compile(r"""
+    (?P<month_name>[A-Za-z]+)\s+                            # Jul 24, 2025 / July 24, 2025
+    (?:(?P<name_day>[0-9]{1,2})(?P<comma>,)?\s+)?           # Jul 24 2025 / Jan 2025 / January 2025
+    (?P<name_year>[0-9]{4})
+  | (?P<day_first>[0-9]{1,2})\s+(?P<day_month>[A-Za-z]{3})\s+(?P<day_year>[0-9]{4})   # 24 Jul 2025
+  | (?P<iso_year>[0-9]{4})-(?P<iso_month>[0-9]{1,2})-(?P<iso_day>[0-9]{1,2})          # 2025-01-15
+  | (?P<num_a>[0-9]{1,2})(?P<sep>[/-])(?P<num_b>[0-9]{1,2})(?P=sep)(?P<num_year>[0-9]{4})  # 1/15/2025, 15-01-2025
+  | (?P<year_only>[0-9]{4})                                 # 2025
+""", re.VERBOSE)
+
+def format_date(year, month, day):
+    """Build a YYYY-MM-DD string, None if the date does not exist."""
+    try:
+        value = date(year, month, day)
+    except ValueError:
+        return None
+    if year < 1000:
+        # strftime does not zero-pad years below 1000 on every platform, keep its output
+        return value.strftime("%Y-%m-%d")
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
+def parse_date_uncached(date_str, day_first=None):
+    """Parse a date string in one pass. Returns YYYY-MM-DD or None."""
+    if not date_str or not isinstance(date_str, str):
+        return None
+    match = DATE_PATTERN.fullmatch(date_str.strip())
+    if not match:
+        return None
+    groups = match.groupdict()
+
+    if groups['month_name']:
+        name = groups['month_name'].lower()
+        if len(name) == 3:
+            month = MONTH_ABBR.get(name)
+        elif groups['name_day'] and not groups['comma']:
+            # "July 24 2025" was never supported
+            return None
+        else:
+            month = MONTH_FULL.get(name)
+        if not month:
+            return None
+        day = int(groups['name_day']) if groups['name_day'] else 1
+        return format_date(int(groups['name_year']), month, day)
+
+    if groups['day_first']:
+        month = MONTH_ABBR.get(groups['day_month'].lower())
+        if not month:
+            return None
+        return format_date(int(groups['day_year']), month, int(groups['day_first']))
+
+    if groups['iso_year']:
+        return format_date(int(groups['iso_year']), int(groups['iso_month']), int(groups['iso_day']))
+
+    if groups['num_a']:
+        a, b = int(groups['num_a']), int(groups['num_b'])
+        if day_first is None:
+            day_first = DASH_DAY_FIRST if groups['sep'] == '-' else SLASH_DAY_FIRST
+        day, month = (a, b) if day_first else (b, a)
+        return format_date(int(groups['num_year']), month, day)
+
+    # Year only: January 1st (returned as-is, like before)
+    return f"{groups['year_only']}-01-01"
+
+@lru_cache(maxsize=1024)
+def parse_date(date_str, day_first=None):
+    """Memoized parse_date_uncached(), scraped pages repeat the same date strings a lot."""
+    return parse_date_uncached(date_str, day_first)
@@ -1,54 +1,251 @@
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# How long (ms) a read waits while Ombi holds a write lock
+BUSY_TIMEOUT_MS = 5000
+
+# Status vertaling voor de tekstregels
+STATUS_NL = {
+    "Released": "Uitgebracht",
+    "Post Production": "Postproductie"
+}
+
+class MovieRequest:
+    """One pending movie request from the Ombi database."""
+    __slots__ = ('request_id', 'title', 'release_date', 'status', 'requested_date',
+                 'user_name', 'tmdb_id', 'approved', 'available')
+
+    def __init__(self, request_id, title, release_date=None, status=None, requested_date=None,
+                 user_name="Onbekend", tmdb_id=None, approved=False, available=False):
+        self.request_id = request_id
+        self.title = title
+        self.release_date = release_date
+        self.status = status
+        self.requested_date = requested_date
+        self.user_name = user_name
+        self.tmdb_id = tmdb_id
+        self.approved = approved
+        self.available = available
+
+    @property
+    def year(self):
+        return self.release_date.year if self.release_date else None
+
+    def to_line(self):
+        """Format as the tab-separated line the GUI expects (same layout as the Ombi request list)."""
+        release_fmt = self.release_date.strftime("(%m/%d/%Y)") if self.release_date else "(?)"
+        req_fmt = self.requested_date.strftime("%b %d, %Y") if self.requested_date else "-"
+        status_nl = STATUS_NL.get(self.status, self.status)
+        return f"{self.title} {release_fmt}\t{self.user_name}\t{status_nl}\tWacht op goedkeuring\t{req_fmt}"
+
+    def __repr__(self):
+        return f"MovieRequest({self.request_id!r}, {self.title!r}, year={self.year!r}, tmdb_id={self.tmdb_id!r})"
+
+def parse_db_date(value):
+    """Parse an Ombi date column ('2025-07-01 00:00:00'), None for empty or 0001-01-01 placeholders."""
+    if not value or "0001" in value:
+        return None
+    try:
+        return datetime.strptime(value.split(" ")[0], "%Y-%m-%d").date()
+    except ValueError:
+        return None
 
 def connect_db(db_path="ombi.db"):
-    return sqlite3.connect(db_path)
+    """Open the Ombi database read-only, so reading never blocks (or locks out) Ombi itself."""
+    # mode=ro also stops sqlite from silently creating an empty ombi.db for a wrong path
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT_MS / 1000)
+    # Wait for Ombi's write transactions instead of failing with "database is locked"
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA query_only = ON")
+    return conn
 
-def get_pending_requests(conn):
-    cursor = conn.cursor()
-
-    # Haal gebruikers op
-    cursor.execute("SELECT Id, UserName FROM AspNetUsers")
-    user_map = {row[0]: row[1] for row in cursor.fetchall()}
-
-    cursor.execute("""
-        SELECT Title, ReleaseDate, Status, RequestedDate, RequestedUserId, Approved, Available
-        FROM MovieRequests
-        WHERE Approved = 0 AND (Available = 0 OR Available IS NULL)
-        ORDER BY ReleaseDate ASC
-    """)
-
-    output = []
-    for title, release, status, req_date, user_id, approved, available in cursor.fetchall():
-        username = user_map.get(user_id, "Onbekend")
-
-        # Status vertaling
-        status_nl = {
-            "Released": "Uitgebracht",
-            "Post Production": "Postproductie"
-        }.get(status, status)
-
-        # Format release
-        if release and "0001" not in release:
-            try:
-                release_fmt = datetime.strptime(release.split(" ")[0], "%Y-%m-%d").strftime("(%m/%d/%Y)")
-            except:
-                release_fmt = "(?)"
-        else:
-            release_fmt = "(?)"
-
-        # Format aanvraagdatum
-        if req_date and "0001" not in req_date:
-            try:
-                req_fmt = datetime.strptime(req_date.split(" ")[0], "%Y-%m-%d").strftime("%b %d, %Y")
-            except:
-                req_fmt = "-"
+# Indexes that make the RequestFilter queries cheap on big installations. The checker opens
+# ombi.db read-only and never changes Ombi's schema, so applying them is up to the admin.
+SUGGESTED_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS IX_MovieRequests_Approved_Available ON MovieRequests (Approved, Available)",
+    "CREATE INDEX IF NOT EXISTS IX_MovieRequests_4K ON MovieRequests (Has4KRequest, Approved4K, Available4K)",
+    "CREATE INDEX IF NOT EXISTS IX_MovieRequests_RequestedDate ON MovieRequests (RequestedDate)",
+    "CREATE INDEX IF NOT EXISTS IX_MovieRequests_ReleaseDate ON MovieRequests (ReleaseDate)",
+]
+
+class RequestFilter:
+    """Which movie requests to check, compiled into a parameterized WHERE clause.
+
+    The default (pending HD requests that are not available) is what the checker always used.
+    """
+
+    APPROVALS = ("pending", "approved", "any")
+    QUALITIES = ("hd", "4k", "any")
+
+    def __init__(self, approval="pending", quality="hd", users=None,
+                 requested_from=None, requested_to=None, released_from=None, released_to=None):
+        if approval not in self.APPROVALS:
+            raise ValueError(f"Unknown approval filter: {approval}")
+        if quality not in self.QUALITIES:
+            raise ValueError(f"Unknown quality filter: {quality}")
+        self.approval = approval
+        self.quality = quality
+        self.users = list(users or [])
+        self.requested_from = requested_from
+        self.requested_to = requested_to
+        self.released_from = released_from
+        self.released_to = released_to
+
+    def is_default(self):
+        """True when this selects every pending request (so missing ones are really gone)."""
+        return (self.approval == "pending" and self.quality == "hd" and not self.users
+                and not any((self.requested_from, self.requested_to, self.released_from, self.released_to)))
+
+    def status_clause(self, approved_column, available_column):
+        clause = f"({available_column} = 0 OR {available_column} IS NULL)"
+        if self.approval == "pending":
+            clause = f"{approved_column} = 0 AND {clause}"
+        elif self.approval == "approved":
+            clause = f"{approved_column} = 1 AND {clause}"
+        return clause
+
+    def to_sql(self):
+        """WHERE clause (columns of MovieRequests r and AspNetUsers u) and its parameters."""
+        hd = self.status_clause("r.Approved", "r.Available")
+        four_k = f"r.Has4KRequest = 1 AND {self.status_clause('r.Approved4K', 'r.Available4K')}"
+        if self.quality == "hd":
+            conditions = [hd]
+        elif self.quality == "4k":
+            conditions = [four_k]
         else:
-            req_fmt = "-"
+            conditions = [f"(({hd}) OR ({four_k}))"]
+        params = []
+
+        if self.users:
+            # NormalizedUserName is the indexed, upper-case copy ASP.NET Identity keeps
+            conditions.append(f"u.NormalizedUserName IN ({', '.join('?' for _ in self.users)})")
+            params.extend(user.upper() for user in self.users)
 
-        output.append(f"{title} {release_fmt}\t{username}\t{status_nl}\tWacht op goedkeuring\t{req_fmt}")
+        # Ombi stores dates as 'YYYY-MM-DD HH:MM:SS' text, so ranges compare as strings
+        for column, start, end in (("r.RequestedDate", self.requested_from, self.requested_to),
+                                   ("r.ReleaseDate", self.released_from, self.released_to)):
+            if start:
+                conditions.append(f"{column} >= ?")
+                params.append(start.strftime("%Y-%m-%d"))
+            if end:
+                conditions.append(f"{column} < ?")
+                params.append((end + timedelta(days=1)).strftime("%Y-%m-%d"))
 
-    return output
+        return " AND ".join(conditions), params
+
+def iter_pending_movie_requests(conn, after_id=None, max_id=None, batch_size=100, request_filter=None):
+    """Yield the pending movie requests as MovieRequest records, one page of batch_size at a time.
+
+    Every page is a short query of its own (keyset paging on ReleaseDate, Id) whose cursor
+    is closed before its rows are yielded, so no read stays open on ombi.db while the caller
+    works through them. Each page sees the database as it is when that page is read.
+    """
+    where, params = (request_filter or RequestFilter()).to_sql()
+    if after_id is not None:
+        where += " AND r.Id > ?"
+        params.append(after_id)
+    if max_id is not None:
+        where += " AND r.Id <= ?"
+        params.append(max_id)
+
+    last_key = None
+    while True:
+        page_where, page_params = where, list(params)
+        if last_key is not None:
+            page_where += " AND (COALESCE(r.ReleaseDate, '') > ? OR (COALESCE(r.ReleaseDate, '') = ? AND r.Id > ?))"
+            page_params += [last_key[0], last_key[0], last_key[1]]
+
+        # Gebruikersnaam via een join, niet de hele AspNetUsers tabel inlezen
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"""
+                SELECT r.Id, r.Title, r.ReleaseDate, r.Status, r.RequestedDate, u.UserName,
+                       r.Approved, r.Available, r.TheMovieDbId
+                FROM MovieRequests r
+                LEFT JOIN AspNetUsers u ON u.Id = r.RequestedUserId
+                WHERE {page_where}
+                ORDER BY COALESCE(r.ReleaseDate, '') ASC, r.Id ASC
+                LIMIT ?
+            """, page_params + [batch_size])
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        for request_id, title, release, status, req_date, user_name, approved, available, tmdb_id in rows:
+            yield MovieRequest(
+                request_id,
+                title,
+                release_date=parse_db_date(release),
+                status=status,
+                requested_date=parse_db_date(req_date),
+                user_name=user_name or "Onbekend",
+                tmdb_id=tmdb_id or None,
+                approved=bool(approved),
+                available=bool(available),
+            )
+        if len(rows) < batch_size:
+            break
+        last_key = (rows[-1][2] or '', rows[-1][0])
+
+def fetch_pending_movie_requests(conn, after_id=None, max_id=None, request_filter=None):
+    """Return the pending movie requests as MovieRequest records, optionally only an Id range."""
+    return list(iter_pending_movie_requests(conn, after_id, max_id, request_filter=request_filter))
+
+class RequestWatcher:
+    """Cheap change detection on a live Ombi database, for the daemon mode.
+
+    PRAGMA data_version only changes when another connection committed, so an
+    idle database costs one pragma per poll. After a change only requests with
+    an Id above the highest one seen so far are fetched.
+    """
+
+    def __init__(self, db_path="ombi.db", request_filter=None):
+        self.conn = connect_db(db_path)
+        self.request_filter = request_filter
+        self.data_version = self.read_data_version()
+        self.max_id = self.read_max_id()
+
+    def read_data_version(self):
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def read_max_id(self):
+        return self.conn.execute("SELECT COALESCE(MAX(Id), 0) FROM MovieRequests").fetchone()[0]
+
+    def changed(self):
+        """True when the database was written to since the last call."""
+        data_version = self.read_data_version()
+        if data_version == self.data_version:
+            return False
+        self.data_version = data_version
+        return True
+
+    def pending(self):
+        """All pending requests."""
+        return fetch_pending_movie_requests(self.conn, request_filter=self.request_filter)
+
+    def sweep(self):
+        """All pending requests up to the highest Id now; new_requests() continues after them."""
+        self.max_id = self.read_max_id()
+        return fetch_pending_movie_requests(self.conn, max_id=self.max_id, request_filter=self.request_filter)
+
+    def new_requests(self):
+        """Pending requests that arrived since the last call."""
+        max_id = self.read_max_id()
+        if max_id <= self.max_id:
+            return []
+        requests = fetch_pending_movie_requests(self.conn, after_id=self.max_id, max_id=max_id,
+                                                request_filter=self.request_filter)
+        self.max_id = max_id
+        return requests
+
+    def close(self):
+        self.conn.close()
+
+def get_pending_requests(conn):
+    """Return the pending requests as tab-separated text lines, for pasting into the GUI."""
+    return [request.to_line() for request in iter_pending_movie_requests(conn)]
 
 def main():
     conn = connect_db()
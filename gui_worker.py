@@ -0,0 +1,55 @@
+import queue
+import threading
+
+class CheckWorker:
+    """Runs a long check loop on a background thread and hands its events to Tk.
+
+    The loop gets the worker as first argument, reports with post(kind, payload)
+    and stops early when cancelled is set. Tk is only touched from the main
+    thread: poll() drains the queue through window.after and calls on_event.
+    """
+
+    def __init__(self, window, on_event, poll_ms=100):
+        self.window = window
+        self.on_event = on_event
+        self.poll_ms = poll_ms
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.thread = None
+
+    @property
+    def running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self, target, *args):
+        self.cancelled.clear()
+        self.thread = threading.Thread(target=self.run, args=(target, args), daemon=True)
+        self.thread.start()
+        self.window.after(self.poll_ms, self.poll)
+
+    def run(self, target, args):
+        try:
+            target(self, *args)
+        except Exception as e:
+            self.post("error", str(e))
+        finally:
+            self.post("done", self.cancelled.is_set())
+
+    def post(self, kind, payload=None):
+        """Called from the worker thread."""
+        self.events.put((kind, payload))
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def poll(self):
+        done = False
+        while True:
+            try:
+                kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            self.on_event(kind, payload)
+            done = done or kind == "done"
+        if not done:
+            self.window.after(self.poll_ms, self.poll)
@@ -0,0 +1,568 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+# The page is str.format templates: PAGE_START, one CARD per movie, PAGE_END.
+# Literal braces (CSS, JavaScript) are doubled.
+
+BACKGROUND_STYLE = """
+            background: url('{background_url}') center center fixed;
+            background-size: cover;
+        """
+
+DEFAULT_BACKGROUND_STYLE = "background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);"
+
+# Darkens a custom background for better readability
+OVERLAY_STYLE = """
+        body::before {
+            content: '';
+            position: fixed;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            background: rgba(0, 0, 0, 0.3);
+            z-index: -1;
+        }
+        """
+
+PAGE_START = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Movie Download Status Report</title>
+    <link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>🎬</text></svg>">
+    <style>
+        body {{
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            {background_style}
+            min-height: 100vh;
+        }}
+        {overlay_style}
+        .container {{
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 15px;
+            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
+            overflow: hidden;
+            position: relative;
+            z-index: 1;
+        }}
+        .header {{
+            background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }}
+        .header h1 {{
+            margin: 0;
+            font-size: 2.5em;
+            font-weight: 300;
+        }}
+        .header p {{
+            margin: 10px 0 0 0;
+            opacity: 0.8;
+            font-size: 1.1em;
+        }}
+        .stats {{
+            display: flex;
+            justify-content: space-around;
+            padding: 20px;
+            background: #f8f9fa;
+            border-bottom: 1px solid #dee2e6;
+        }}
+        .stat {{
+            text-align: center;
+            cursor: pointer;
+            padding: 10px;
+            border-radius: 8px;
+            transition: all 0.3s ease;
+            user-select: none;
+        }}
+        .stat:hover {{
+            background: rgba(0,0,0,0.05);
+            transform: translateY(-2px);
+        }}
+        .stat.active {{
+            background: rgba(0,123,255,0.1);
+            border: 2px solid #007bff;
+        }}
+        .stat-number {{
+            font-size: 2em;
+            font-weight: bold;
+            color: #2c3e50;
+        }}
+        .stat-label {{
+            color: #6c757d;
+            font-size: 0.9em;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }}
+        .filter-info {{
+            text-align: center;
+            padding: 10px 20px;
+            background: #e3f2fd;
+            color: #1976d2;
+            font-weight: bold;
+            display: none;
+        }}
+        .movies-grid {{
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
+            gap: 20px;
+            padding: 30px;
+        }}
+        .movie-card {{
+            background: white;
+            border-radius: 10px;
+            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+            overflow: hidden;
+            transition: transform 0.3s ease, box-shadow 0.3s ease;
+            text-decoration: none;
+            color: inherit;
+            display: block;
+        }}
+        .movie-card:hover {{
+            transform: translateY(-5px);
+            box-shadow: 0 8px 25px rgba(0,0,0,0.2);
+        }}
+        .movie-card.hidden {{
+            display: none;
+        }}
+        .movie-poster {{
+            width: 100%;
+            height: 400px;
+            object-fit: cover;
+            background: linear-gradient(45deg, #f0f0f0 25%, transparent 25%), 
+                        linear-gradient(-45deg, #f0f0f0 25%, transparent 25%), 
+                        linear-gradient(45deg, transparent 75%, #f0f0f0 75%), 
+                        linear-gradient(-45deg, transparent 75%, #f0f0f0 75%);
+            background-size: 20px 20px;
+            background-position: 0 0, 0 10px, 10px -10px, -10px 0px;
+        }}
+        .movie-info {{
+            padding: 20px;
+        }}
+        .movie-title {{
+            font-size: 1.2em;
+            font-weight: bold;
+            margin-bottom: 10px;
+            color: #2c3e50;
+            line-height: 1.3;
+        }}
+        .movie-overview {{
+            color: #6c757d;
+            font-size: 0.9em;
+            line-height: 1.4;
+            margin-bottom: 15px;
+            display: -webkit-box;
+            -webkit-line-clamp: 3;
+            -webkit-box-orient: vertical;
+            overflow: hidden;
+        }}
+        .movie-meta {{
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 15px;
+        }}
+        .release-date {{
+            background: #e9ecef;
+            padding: 5px 10px;
+            border-radius: 15px;
+            font-size: 0.8em;
+            color: #495057;
+        }}
+        .status-badge {{
+            padding: 8px 16px;
+            border-radius: 20px;
+            font-weight: bold;
+            font-size: 0.9em;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }}
+        .status-yes {{
+            background: #d4edda;
+            color: #155724;
+            border: 1px solid #c3e6cb;
+        }}
+        .status-soon {{
+            background: #fff3cd;
+            color: #856404;
+            border: 1px solid #ffeaa7;
+        }}
+        .status-no {{
+            background: #f8d7da;
+            color: #721c24;
+            border: 1px solid #f5c6cb;
+        }}
+        .status-tbd {{
+            background: #e2e3e5;
+            color: #383d41;
+            border: 1px solid #d6d8db;
+        }}
+        .ombi-link {{
+            display: inline-block;
+            background: #007bff;
+            color: white;
+            padding: 8px 16px;
+            border-radius: 5px;
+            text-decoration: none;
+            font-size: 0.9em;
+            font-weight: bold;
+            transition: background-color 0.3s ease;
+            margin-right: 8px;
+        }}
+        .ombi-link:hover {{
+            background: #0056b3;
+            color: white;
+            text-decoration: none;
+        }}
+        .vuniper-link {{
+            display: inline-block;
+            background: #28a745;
+            color: white;
+            padding: 8px 16px;
+            border-radius: 5px;
+            text-decoration: none;
+            font-size: 0.9em;
+            font-weight: bold;
+            transition: background-color 0.3s ease;
+        }}
+        .vuniper-link:hover {{
+            background: #1e7e34;
+            color: white;
+            text-decoration: none;
+        }}
+        .footer {{
+            text-align: center;
+            padding: 20px;
+            background: #f8f9fa;
+            color: #6c757d;
+            font-size: 0.9em;
+        }}
+        .footer a {{
+            color: #007bff;
+            text-decoration: none;
+        }}
+        .footer a:hover {{
+            text-decoration: underline;
+        }}
+        @media (max-width: 768px) {{
+            .movies-grid {{
+                grid-template-columns: 1fr;
+                padding: 15px;
+            }}
+            .stats {{
+                flex-direction: column;
+                gap: 15px;
+            }}
+            .header h1 {{
+                font-size: 2em;
+            }}
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🎬 Movie Download Status Report</h1>
+            <p>Generated on {current_date}</p>
+        </div>
+        
+        <div class="stats">
+            <div class="stat" data-filter="all" onclick="filterMovies('all')">
+                <div class="stat-number">{total_movies}</div>
+                <div class="stat-label">Total Movies</div>
+            </div>
+            <div class="stat" data-filter="yes" onclick="filterMovies('yes')">
+                <div class="stat-number" style="color: #28a745;">{available_count}</div>
+                <div class="stat-label">Available Now</div>
+            </div>
+            <div class="stat" data-filter="soon" onclick="filterMovies('soon')">
+                <div class="stat-number" style="color: #ffc107;">{soon_count}</div>
+                <div class="stat-label">Coming Soon</div>
+            </div>
+            <div class="stat" data-filter="unavailable" onclick="filterMovies('unavailable')">
+                <div class="stat-number" style="color: #dc3545;">{unavailable_count}</div>
+                <div class="stat-label">Not Available</div>
+            </div>
+        </div>
+        
+        <div class="filter-info" id="filterInfo">
+            Showing all movies
+        </div>
+        
+        <div class="movies-grid" id="moviesGrid">"""
+
+CARD = """
+            <div class="movie-card" data-filter="{filter_category}">
+                <img src="{poster_url}" alt="{title} Poster" class="movie-poster" loading="lazy" decoding="async"
+                     onerror="this.style.display='none';">
+                <div class="movie-info">
+                    <div class="movie-title">{title}</div>
+                    <div class="movie-overview">{overview}</div>
+                    <div class="movie-meta">
+                        <div style="display: flex; flex-direction: column; gap: 5px;">
+                            <span class="release-date">🎭 Theater: {theater_date}</span>
+                            <span class="release-date">💿 Digital: {digital_date}</span>
+                        </div>
+                        <span class="status-badge {status_class}">{status}</span>
+                    </div>
+                    {links_html}
+                </div>
+            </div>"""
+
+PAGE_END = """
+        </div>
+        
+        <div class="footer">
+            <p>Generated by ombicheck.py | Data from The Movie Database (TMDb) and Vuniper | <a href="https://github.com/WilmeRWubS/OmbiChecker" target="_blank" rel="noopener noreferrer">https://github.com/WilmeRWubS/OmbiChecker</a></p>
+        </div>
+    </div>
+    
+    <script>
+        let currentFilter = 'all';
+        
+        function filterMovies(filter) {{
+            currentFilter = filter;
+            const movieCards = document.querySelectorAll('.movie-card');
+            const filterInfo = document.getElementById('filterInfo');
+            const stats = document.querySelectorAll('.stat');
+            
+            // Remove active class from all stats
+            stats.forEach(stat => stat.classList.remove('active'));
+            
+            // Add active class to clicked stat
+            document.querySelector(`[data-filter="${{filter}}"]`).classList.add('active');
+            
+            // Show/hide movies based on filter
+            movieCards.forEach(card => {{
+                if (filter === 'all') {{
+                    card.classList.remove('hidden');
+                }} else {{
+                    const cardFilter = card.getAttribute('data-filter');
+                    if (cardFilter === filter) {{
+                        card.classList.remove('hidden');
+                    }} else {{
+                        card.classList.add('hidden');
+                    }}
+                }}
+            }});
+            
+            // Update filter info
+            const visibleCards = document.querySelectorAll('.movie-card:not(.hidden)').length;
+            let filterText = '';
+            
+            switch(filter) {{
+                case 'all':
+                    filterText = `Showing all {total_movies} movies`;
+                    filterInfo.style.display = 'none';
+                    break;
+                case 'yes':
+                    filterText = `Showing ${{visibleCards}} available movies`;
+                    filterInfo.style.display = 'block';
+                    break;
+                case 'soon':
+                    filterText = `Showing ${{visibleCards}} movies coming soon`;
+                    filterInfo.style.display = 'block';
+                    break;
+                case 'unavailable':
+                    filterText = `Showing ${{visibleCards}} unavailable movies`;
+                    filterInfo.style.display = 'block';
+                    break;
+            }}
+            
+            filterInfo.textContent = filterText;
+        }}
+        
+        // Initialize with all movies shown
+        document.addEventListener('DOMContentLoaded', function() {{
+            filterMovies('all');
+        }});
+    </script>
+</body>
+</html>"""
+
+# Changes whenever the templates change, so cached cards and page digests from older code are not reused
+TEMPLATE_KEY = hashlib.sha1((PAGE_START + CARD + PAGE_END).encode("utf-8")).hexdigest()
+
+# The result fields a card shows
+CARD_FIELDS = ('title', 'status', 'theater_date', 'digital_date', 'poster_url', 'overview', 'movie_id', 'vuniper_url')
+
+# Cards that were not part of any report for this long are removed from the cache
+CARD_CACHE_TTL = 30 * 24 * 3600
+
+def filter_category(status):
+    """Stat/filter group of a status: yes, soon or unavailable (No and TBD)."""
+    if status == 'Yes':
+        return 'yes'
+    if status == 'Soon':
+        return 'soon'
+    return 'unavailable'
+
+def report_stats(results):
+    """Counts for the stats bar, in one pass over the results."""
+    stats = {'total': 0, 'yes': 0, 'soon': 0, 'unavailable': 0}
+    for movie in results:
+        stats['total'] += 1
+        stats[filter_category(movie['status'])] += 1
+    return stats
+
+def render_card(movie, ombi_site_url=""):
+    status_class = f"status-{movie['status'].lower()}"
+    if movie['status'] == 'TBD':
+        status_class = "status-tbd"
+
+    links_html = ""
+    if ombi_site_url and movie.get('movie_id'):
+        ombi_url = f"{ombi_site_url}/details/movie/{movie['movie_id']}"
+        links_html += f'<a href="{ombi_url}" class="ombi-link" target="_blank">Ombi</a>'
+    if movie.get('vuniper_url'):
+        links_html += f'<a href="{movie["vuniper_url"]}" class="vuniper-link" target="_blank">Vuniper</a>'
+
+    return CARD.format(
+        filter_category=filter_category(movie['status']),
+        poster_url=movie['poster_url'],
+        title=movie['title'],
+        overview=movie['overview'],
+        theater_date=movie.get('theater_date', 'TBD'),
+        digital_date=movie.get('digital_date', 'TBD'),
+        status_class=status_class,
+        status=movie['status'],
+        links_html=links_html,
+    )
+
+def card_key(movie, ombi_site_url=""):
+    """Hash of everything a card is rendered from."""
+    fields = [TEMPLATE_KEY, ombi_site_url] + [movie.get(field) for field in CARD_FIELDS]
+    return hashlib.sha1(json.dumps(fields, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+
+def report_digest(results, options):
+    """Hash of everything a report is rendered from, except the generation time."""
+    digest = hashlib.sha1(json.dumps(sorted(options.items()), default=str).encode("utf-8"))
+    for movie in results:
+        digest.update(card_key(movie, options.get('ombi_site_url', "")).encode("ascii"))
+    return digest.hexdigest()
+
+class ReportCache:
+    """Rendered cards by card_key, and the digest of the last report written to each path."""
+
+    def __init__(self, db_path="ombicheck_report_cache.db"):
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self.used = []  # cache hits since the last report, their used_at is updated by written()
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS report_cards (
+                card_key TEXT PRIMARY KEY,
+                html TEXT NOT NULL,
+                used_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS report_files (
+                path TEXT PRIMARY KEY,
+                digest TEXT NOT NULL,
+                written_at REAL NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def card(self, movie, ombi_site_url=""):
+        """The card of a movie, rendered only when its fields changed since it was cached."""
+        key = card_key(movie, ombi_site_url)
+        row = self.conn.execute("SELECT html FROM report_cards WHERE card_key = ?", (key,)).fetchone()
+        if row:
+            self.hits += 1
+            self.used.append(key)
+            return row[0]
+        self.misses += 1
+        html = render_card(movie, ombi_site_url)
+        self.conn.execute("INSERT OR REPLACE INTO report_cards (card_key, html, used_at) VALUES (?, ?, ?)",
+                          (key, html, time.time()))
+        return html
+
+    def file_digest(self, path):
+        row = self.conn.execute("SELECT digest FROM report_files WHERE path = ?",
+                                (os.path.abspath(path),)).fetchone()
+        return row[0] if row else None
+
+    def written(self, path, digest):
+        """Remember what was written to path and drop cards no report used for a while."""
+        now = time.time()
+        self.conn.execute("INSERT OR REPLACE INTO report_files (path, digest, written_at) VALUES (?, ?, ?)",
+                          (os.path.abspath(path), digest, now))
+        self.conn.executemany("UPDATE report_cards SET used_at = ? WHERE card_key = ?",
+                              [(now, key) for key in self.used])
+        self.used = []
+        self.conn.execute("DELETE FROM report_cards WHERE used_at < ?", (now - CARD_CACHE_TTL,))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+def iter_report_html(results, background_url=None, ombi_site_url="", stats=None, card_cache=None):
+    """Yield the report page piece by piece: the page start, one card per movie, the page end.
+
+    results is iterated once for the cards; pass stats (see report_stats) to avoid
+    the counting pass when the results are not a list. With a card_cache, unchanged
+    cards are taken from the cache instead of being rendered again.
+    """
+    if stats is None:
+        stats = report_stats(results)
+    if background_url:
+        background_style = BACKGROUND_STYLE.format(background_url=background_url)
+        overlay_style = OVERLAY_STYLE
+    else:
+        background_style = DEFAULT_BACKGROUND_STYLE
+        overlay_style = ""
+
+    yield PAGE_START.format(
+        background_style=background_style,
+        overlay_style=overlay_style,
+        current_date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        total_movies=stats['total'],
+        available_count=stats['yes'],
+        soon_count=stats['soon'],
+        unavailable_count=stats['unavailable'],
+    )
+    for movie in results:
+        if card_cache is not None:
+            yield card_cache.card(movie, ombi_site_url)
+        else:
+            yield render_card(movie, ombi_site_url)
+    yield PAGE_END.format(total_movies=stats['total'])
+
+def write_report(path, results, cache=None, **options):
+    """Write the report to path card by card, without building the page in memory.
+
+    The page is written to path.tmp first and then replaces path, so nobody sees a
+    half-written report. With a cache (ReportCache), a report with the same cards and
+    settings as the last one written to path is left alone: returns False.
+    """
+    digest = None
+    if cache is not None:
+        digest = report_digest(results, options)
+        if os.path.exists(path) and cache.file_digest(path) == digest:
+            return False
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(iter_report_html(results, card_cache=cache, **options))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if cache is not None:
+        cache.written(path, digest)
+    return True
@@ -1,4 +1,3 @@
-import requests
 import tkinter as tk
 from tkinter import scrolledtext, ttk, filedialog, messagebox
 import re
@@ -6,9 +5,10 @@ from datetime import datetime
 import os
 import webbrowser
 import time
-import sqlite3
 import argparse
 import sys
+import sqlite3
+import contextlib
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -16,6 +16,20 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import urllib.parse
+from custom_dates import CustomDates, CustomDatesStore, load_custom_dates
+from dateparse import parse_date
+from dbcheck import connect_db, get_pending_requests, iter_pending_movie_requests, RequestFilter, RequestWatcher
+from tmdb_client import TMDbClient, TMDbPrefetcher, digital_release_date
+from vuniper_cache import VuniperCache
+from scrape_pool import RateLimiter, DriverPool, PooledDriver, map_in_order
+from vuniper_http import VuniperHttpClient, score_suggestion
+from check_state import CheckState
+from gui_worker import CheckWorker
+from result_store import ResultStore
+from result_output import ResultWriter, FORMATS
+from result_sort import add_sort_keys, choose_sort_column, sort_results_by, sort_marker
+from html_report import iter_report_html, write_report, ReportCache
+from poster_cache import PosterCache
 
 # Your TMDb Bearer Token (still used for poster images and descriptions)
 TMDB_BEARER_TOKEN = "enterhere"
@@ -26,15 +40,27 @@ CUSTOM_BACKGROUND_URL = "https://i.imgur.com/9QY51tm.jpeg"  # URL to background
 HTML_LANGUAGE = "nl-NL"  # Language code for TMDb API (e.g., "en-US", "es-ES", "fr-FR", "de-DE")
 OMBI_SITE_URL = ""  # Ombi site URL (e.g., "https://ombi.yourdomain.com")
 
-HEADERS = {
-    "Authorization": f"Bearer {TMDB_BEARER_TOKEN}",
-    "accept": "application/json"
-}
+# Politeness towards Vuniper, shared by all browser workers
+VUNIPER_REQUESTS_PER_SECOND = 2.0
+vuniper_rate_limiter = RateLimiter(VUNIPER_REQUESTS_PER_SECOND)
+
+# Upper limits (seconds) for the explicit waits in the Vuniper scraper
+VUNIPER_WAIT_TIMEOUT = 10
+VUNIPER_SUGGESTION_TIMEOUT = 5
+
+
+# Shared TMDb client (keep-alive session, retries on 429/5xx)
+tmdb_client = TMDbClient(TMDB_BEARER_TOKEN)
+
+# digital_dates.txt next to the script, the CLI can point it elsewhere with --custom-dates
+custom_dates_store = CustomDatesStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), "digital_dates.txt"))
 
 # Global variable to store movie results for sorting
 movie_results = []
+# Current sort order as (column, descending), primary key first
+sort_columns = []
 
-def setup_selenium_driver():
+def setup_selenium_driver(show_errors=True):
     """Setup Chrome driver for web scraping."""
     chrome_options = Options()
     chrome_options.add_argument("--headless")  # Run in background
@@ -48,144 +74,54 @@ def setup_selenium_driver():
         driver = webdriver.Chrome(options=chrome_options)
         return driver
     except Exception as e:
+        if not show_errors:
+            print(f"Failed to initialize Chrome WebDriver: {str(e)}")
+            return None
         messagebox.showerror("WebDriver Error", 
                            f"Failed to initialize Chrome WebDriver. Please ensure Chrome and ChromeDriver are installed.\n\nError: {str(e)}")
         return None
 
-def connect_db(db_path="ombi.db"):
-    return sqlite3.connect(db_path)
-
-def get_pending_requests(conn):
-    cursor = conn.cursor()
-
-    # Haal gebruikers op
-    cursor.execute("SELECT Id, UserName FROM AspNetUsers")
-    user_map = {row[0]: row[1] for row in cursor.fetchall()}
-
-    cursor.execute("""
-        SELECT Title, ReleaseDate, Status, RequestedDate, RequestedUserId, Approved, Available
-        FROM MovieRequests
-        WHERE Approved = 0 AND (Available = 0 OR Available IS NULL)
-        ORDER BY ReleaseDate ASC
-    """)
-
-    output = []
-    for title, release, status, req_date, user_id, approved, available in cursor.fetchall():
-        username = user_map.get(user_id, "Onbekend")
+def vuniper_get(driver, url):
+    """Load a Vuniper page, respecting the shared rate limit."""
+    vuniper_rate_limiter.wait()
+    driver.get(url)
 
-        # Status vertaling
-        status_nl = {
-            "Released": "Uitgebracht",
-            "Post Production": "Postproductie"
-        }.get(status, status)
+def wait_for(driver, condition, wait_stats=None, legacy_sleep=0, timeout=None):
+    """Wait until condition is met (at most timeout seconds). Returns its value, or None on timeout."""
+    start = time.monotonic()
+    try:
+        return WebDriverWait(driver, timeout or VUNIPER_WAIT_TIMEOUT).until(condition)
+    except TimeoutException:
+        return None
+    finally:
+        # Keep track of how long we actually waited vs. the old fixed sleeps
+        if wait_stats is not None:
+            wait_stats['waited'] += time.monotonic() - start
+            wait_stats['legacy'] += legacy_sleep
 
-        # Format release
-        if release and "0001" not in release:
-            try:
-                release_fmt = datetime.strptime(release.split(" ")[0], "%Y-%m-%d").strftime("(%m/%d/%Y)")
-            except:
-                release_fmt = "(?)"
-        else:
-            release_fmt = "(?)"
+def open_vuniper_search(driver, wait_stats=None):
+    """Open the Vuniper homepage and wait until the search box is available."""
+    vuniper_get(driver, "https://vuniper.com")
+    return wait_for(driver, EC.presence_of_element_located((By.ID, "search-input")), wait_stats, legacy_sleep=2)
 
-        # Format aanvraagdatum
-        if req_date and "0001" not in req_date:
-            try:
-                req_fmt = datetime.strptime(req_date.split(" ")[0], "%Y-%m-%d").strftime("%b %d, %Y")
-            except:
-                req_fmt = "-"
-        else:
-            req_fmt = "-"
+def standardize_date(date_str, day_first=None):
+    """Convert various date formats to YYYY-MM-DD format with improved parsing."""
+    # One precompiled pattern and a memo, see dateparse.py.
+    # day_first=None keeps 1/15/2025 month-first and 15-01-2025 day-first.
+    return parse_date(date_str, day_first)
 
-        output.append(f"{title} {release_fmt}\t{username}\t{status_nl}\tWacht op goedkeuring\t{req_fmt}")
+def search_movie_vuniper(title, driver, custom_dates=None, expected_year=None, http_client=None):
+    """Search for a movie on Vuniper.com and complete the release information with digital_dates.txt."""
+    vuniper_info = search_vuniper(title, driver, expected_year, http_client)
+    return apply_custom_dates(title, vuniper_info, custom_dates)
 
-    return output
+def search_vuniper(title, driver, expected_year=None, http_client=None):
+    """Search for a movie on Vuniper.com and get release information with improved search and year matching.
 
-def standardize_date(date_str):
-    """Convert various date formats to YYYY-MM-DD format with improved parsing."""
-    if not date_str:
-        return None
-        
+    Only what Vuniper says, without digital_dates.txt, so it can be cached while the file changes.
+    """
+    wait_stats = {'waited': 0.0, 'legacy': 0.0}
     try:
-        date_str = date_str.strip()
-        
-        # Handle "Jul 24, 2025" format
-        if re.match(r'[A-Za-z]{3}\s+\d{1,2},\s+\d{4}', date_str):
-            date_obj = datetime.strptime(date_str, "%b %d, %Y")
-            return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "July 24, 2025" format (full month name)
-        elif re.match(r'[A-Za-z]+\s+\d{1,2},\s+\d{4}', date_str):
-            date_obj = datetime.strptime(date_str, "%B %d, %Y")
-            return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "Jul 24 2025" format (no comma)
-        elif re.match(r'[A-Za-z]{3}\s+\d{1,2}\s+\d{4}', date_str):
-            date_obj = datetime.strptime(date_str, "%b %d %Y")
-            return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "24 Jul 2025" format (day first)
-        elif re.match(r'\d{1,2}\s+[A-Za-z]{3}\s+\d{4}', date_str):
-            date_obj = datetime.strptime(date_str, "%d %b %Y")
-            return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "1/15/2025" format
-        elif re.match(r'\d{1,2}/\d{1,2}/\d{4}', date_str):
-            date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-            return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "15/1/2025" format (day/month/year - European style)
-        elif re.match(r'\d{1,2}/\d{1,2}/\d{4}', date_str):
-            # Try both formats and see which makes more sense
-            try:
-                # Try MM/DD/YYYY first
-                date_obj = datetime.strptime(date_str, "%m/%d/%Y")
-                return date_obj.strftime("%Y-%m-%d")
-            except ValueError:
-                # If that fails, try DD/MM/YYYY
-                date_obj = datetime.strptime(date_str, "%d/%m/%Y")
-                return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "2025-01-15" format (already standard)
-        elif re.match(r'\d{4}-\d{1,2}-\d{1,2}', date_str):
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "15-01-2025" format (DD-MM-YYYY)
-        elif re.match(r'\d{1,2}-\d{1,2}-\d{4}', date_str):
-            date_obj = datetime.strptime(date_str, "%d-%m-%Y")
-            return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "Jan 2025" format (month and year only - assume 1st day)
-        elif re.match(r'[A-Za-z]{3}\s+\d{4}', date_str):
-            date_obj = datetime.strptime(f"01 {date_str}", "%d %b %Y")
-            return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "January 2025" format (full month name and year only)
-        elif re.match(r'[A-Za-z]+\s+\d{4}', date_str):
-            date_obj = datetime.strptime(f"01 {date_str}", "%d %B %Y")
-            return date_obj.strftime("%Y-%m-%d")
-        
-        # Handle "2025" format (year only - assume January 1st)
-        elif re.match(r'^\d{4}$', date_str):
-            return f"{date_str}-01-01"
-        
-        return None
-        
-    except Exception as e:
-        print(f"Error parsing date '{date_str}': {str(e)}")
-        return None
-
-def search_movie_vuniper(title, driver, custom_dates=None, expected_year=None):
-    """Search for a movie on Vuniper.com and get release information with improved search and year matching."""
-    try:
-        driver.get("https://vuniper.com")
-        time.sleep(2)
-        
-        # Load custom digital dates first
-        if not custom_dates:
-            custom_dates = load_custom_digital_dates()
-        
         # Extract year from title if present and not provided separately
         title_year = None
         clean_title = title
@@ -250,320 +186,191 @@ def search_movie_vuniper(title, driver, custom_dates=None, expected_year=None):
         vuniper_info = None
         vuniper_url = None
         
-        for search_term in search_variations:
-            try:
-                print(f"Trying search term: '{search_term}'")
+        # Try the plain HTTP backend first, the browser is only needed when that finds nothing
+        if http_client:
+            dates, vuniper_url = http_client.find_release_info(
+                search_variations, base_title, important_words, target_year, standardize_date)
+            if dates:
+                vuniper_info = dict(dates, status=release_status(dates['theater_date'], dates['digital_date']),
+                                    source="vuniper-http")
+                print(f"Found release info over HTTP for '{title}': {vuniper_info}")
+            else:
+                print(f"No release info over HTTP for '{title}', falling back to Selenium")
+        
+        if not vuniper_info:
+            open_vuniper_search(driver, wait_stats)
+            
+            for search_term in search_variations:
+                try:
+                    print(f"Trying search term: '{search_term}'")
                 
-                # Find and use search input
-                search_input = driver.find_element(By.ID, "search-input")
-                search_input.clear()
-                search_input.send_keys(search_term)
-                time.sleep(3)  # Give time for suggestions to load
+                    # Find and use search input
+                    search_input = driver.find_element(By.ID, "search-input")
+                    old_suggestions = driver.find_elements(By.CSS_SELECTOR, ".search-suggestion")
+                    search_input.clear()
+                    vuniper_rate_limiter.wait()
+                    search_input.send_keys(search_term)
                 
-                # Try to find suggestions
-                suggestions = driver.find_elements(By.CSS_SELECTOR, ".search-suggestion")
+                    # Wait for the suggestions of this search term (not the previous one) to load
+                    if old_suggestions:
+                        wait_for(driver, EC.staleness_of(old_suggestions[0]), wait_stats,
+                                 timeout=VUNIPER_SUGGESTION_TIMEOUT)
+                    suggestions = wait_for(driver, EC.visibility_of_all_elements_located((By.CSS_SELECTOR, ".search-suggestion")),
+                                           wait_stats, legacy_sleep=3, timeout=VUNIPER_SUGGESTION_TIMEOUT) or []
                 
-                if suggestions:
-                    # Look for the best match with year consideration
-                    best_suggestion = None
-                    best_score = -1
+                    if suggestions:
+                        # Look for the best match with year consideration
+                        best_suggestion = None
+                        best_score = -1
                     
-                    for suggestion in suggestions:
-                        suggestion_text = suggestion.text.strip()
-                        print(f"Evaluating suggestion: '{suggestion_text}'")
-                        
-                        # Extract year from suggestion text
-                        suggestion_year = None
-                        year_match = re.search(r'(\d{4})', suggestion_text)
-                        if year_match:
-                            suggestion_year = int(year_match.group(1))
-                        
-                        # Calculate match score
-                        score = 0
-                        suggestion_lower = suggestion_text.lower()
-                        
-                        # Check if this is a "no results" message
-                        if any(phrase in suggestion_lower for phrase in ['no results', 'searched movies', 'view results']):
-                            print(f"Skipping 'no results' suggestion: {suggestion_text}")
-                            continue
-                        
-                        # Year matching (highest priority)
-                        if target_year and suggestion_year:
-                            if suggestion_year == target_year:
-                                score += 1000  # Exact year match gets highest priority
-                                print(f"Exact year match: {suggestion_year}")
-                            elif abs(suggestion_year - target_year) <= 1:
-                                score += 500  # Close year match
-                                print(f"Close year match: {suggestion_year} vs {target_year}")
-                            else:
-                                score -= 200  # Wrong year penalty
-                                print(f"Year mismatch: {suggestion_year} vs {target_year}")
-                        elif not target_year and suggestion_year:
-                            # If no target year, prefer older movies (likely the original)
-                            if suggestion_year < 2020:
-                                score += 100
+                        for suggestion in suggestions:
+                            suggestion_text = suggestion.text.strip()
+                            print(f"Evaluating suggestion: '{suggestion_text}'")
                         
-                        # Title matching
-                        if important_words:
-                            word_matches = sum(1 for word in important_words if word.lower() in suggestion_lower)
-                            score += word_matches * 50
-                            print(f"Word matches: {word_matches}/{len(important_words)}")
+                            # Same scoring as the HTTP backend; None marks a "no results" entry
+                            score = score_suggestion(suggestion_text, base_title, important_words, target_year)
+                            if score is None:
+                                print(f"Skipping 'no results' suggestion: {suggestion_text}")
+                                continue
                         
-                        # Exact title match bonus
-                        clean_suggestion = re.sub(r'\s*\d{4}', '', suggestion_text).strip().lower()
-                        if clean_suggestion == base_title.lower():
-                            score += 200
-                            print(f"Exact title match bonus")
+                            print(f"Suggestion '{suggestion_text}' scored: {score}")
                         
-                        print(f"Suggestion '{suggestion_text}' scored: {score}")
-                        
-                        if score > best_score:
-                            best_score = score
-                            best_suggestion = suggestion
+                            if score > best_score:
+                                best_score = score
+                                best_suggestion = suggestion
                     
-                    if best_suggestion:
-                        print(f"Selected best suggestion: '{best_suggestion.text}' (score: {best_score})")
+                        if best_suggestion:
+                            print(f"Selected best suggestion: '{best_suggestion.text}' (score: {best_score})")
                         
-                        best_suggestion.click()
-                        time.sleep(4)  # Give time for page to load
+                            vuniper_rate_limiter.wait()
+                            search_url = driver.current_url
+                            best_suggestion.click()
+                            wait_for(driver, EC.url_changes(search_url), wait_stats, legacy_sleep=4)
                         
-                        # Capture the current URL after clicking
-                        vuniper_url = driver.current_url
-                        print(f"Vuniper URL found: {vuniper_url}")
+                            # Capture the current URL after clicking
+                            vuniper_url = driver.current_url
+                            print(f"Vuniper URL found: {vuniper_url}")
                         
-                        # Try to extract release info
-                        vuniper_info = extract_vuniper_release_info(driver)
+                            # Try to extract release info
+                            vuniper_info = extract_vuniper_release_info(driver, wait_stats)
                         
-                        if vuniper_info and (vuniper_info.get('theater_date') or vuniper_info.get('digital_date')):
-                            print(f"Successfully found release info for '{search_term}': {vuniper_info}")
-                            break  # Found valid info, stop searching
-                        else:
-                            print(f"No release info found for '{search_term}', trying next variation")
-                            # Go back to search for next variation
-                            driver.get("https://vuniper.com")
-                            time.sleep(2)
-                            vuniper_url = None  # Reset URL if no valid info found
-                else:
-                    print(f"No suggestions found for '{search_term}'")
+                            if vuniper_info and (vuniper_info.get('theater_date') or vuniper_info.get('digital_date')):
+                                print(f"Successfully found release info for '{search_term}': {vuniper_info}")
+                                break  # Found valid info, stop searching
+                            else:
+                                print(f"No release info found for '{search_term}', trying next variation")
+                                # Go back to search for next variation
+                                open_vuniper_search(driver, wait_stats)
+                                vuniper_url = None  # Reset URL if no valid info found
+                    else:
+                        print(f"No suggestions found for '{search_term}'")
                     
-            except Exception as e:
-                print(f"Error with search term '{search_term}': {str(e)}")
-                # Try to go back to main page for next attempt
-                try:
-                    driver.get("https://vuniper.com")
-                    time.sleep(2)
-                except:
-                    pass
-                continue
-        
-        # If no digital date from Vuniper, check custom dates file
-        if vuniper_info and not vuniper_info.get('digital_date') and custom_dates:
-            # Try to match against custom dates with flexible matching
-            title_lower = base_title.lower()
-            matched_custom_date = None
-            
-            # Create title variations for matching
-            title_variations = [
-                title_lower,
-                title_lower.replace(":", ""),  # Remove colons
-                title_lower.replace(":", " "),  # Replace colons with spaces
-            ]
-            
-            # Handle "The" prefix
-            if title_lower.startswith("the "):
-                title_variations.append(title_lower.replace("the ", "").strip())
-            else:
-                title_variations.append(f"the {title_lower}")
-            
-            # Try exact matches first
-            for variation in title_variations:
-                if variation in custom_dates:
-                    matched_custom_date = custom_dates[variation]
-                    print(f"Exact match found: '{variation}' = {matched_custom_date}")
-                    break
-            
-            # If no exact match, try partial matching
-            if not matched_custom_date:
-                for custom_title, custom_date in custom_dates.items():
-                    for variation in title_variations:
-                        # Check if titles are similar (contains each other)
-                        if (custom_title in variation or variation in custom_title):
-                            matched_custom_date = custom_date
-                            print(f"Partial match found: '{custom_title}' -> '{variation}' = {matched_custom_date}")
-                            break
-                    if matched_custom_date:
-                        break
-            
-            if matched_custom_date:
-                vuniper_info['digital_date'] = matched_custom_date
-                print(f"Using custom digital date for '{title}': {matched_custom_date}")
-                
-                # Update status based on custom digital date
-                current_date = datetime.now()
-                try:
-                    digital_obj = datetime.strptime(matched_custom_date, "%Y-%m-%d")
-                    vuniper_info['status'] = 'Yes' if digital_obj <= current_date else 'Soon'
-                except:
-                    vuniper_info['status'] = 'Soon'
-        
-        # If still no info found, try custom dates as fallback
-        if not vuniper_info and custom_dates:
-            title_lower = base_title.lower()
-            matched_custom_date = None
-            
-            # Try exact match first
-            if title_lower in custom_dates:
-                matched_custom_date = custom_dates[title_lower]
-            else:
-                # Try partial matching with important words
-                if important_words:
-                    for custom_title, custom_date in custom_dates.items():
-                        # Check if any important words match
-                        if any(word.lower() in custom_title for word in important_words):
-                            matched_custom_date = custom_date
-                            print(f"Matched custom date by keywords: '{custom_title}' -> '{title}' = {custom_date}")
-                            break
-            
-            if matched_custom_date:
-                current_date = datetime.now()
-                try:
-                    digital_obj = datetime.strptime(matched_custom_date, "%Y-%m-%d")
-                    status = 'Yes' if digital_obj <= current_date else 'Soon'
-                except:
-                    status = 'Soon'
-                
-                vuniper_info = {
-                    'theater_date': None,
-                    'digital_date': matched_custom_date,
-                    'status': status
-                }
-                print(f"Using custom date as primary source for '{title}': {matched_custom_date}")
+                except Exception as e:
+                    print(f"Error with search term '{search_term}': {str(e)}")
+                    # Try to go back to main page for next attempt
+                    try:
+                        open_vuniper_search(driver, wait_stats)
+                    except:
+                        pass
+                    continue
         
         # Add the Vuniper URL to the result if we found valid info
         if vuniper_info and vuniper_url:
             vuniper_info['vuniper_url'] = vuniper_url
+        if vuniper_info:
+            vuniper_info.setdefault('source', 'vuniper')
         
         return vuniper_info
         
+    except RuntimeError:
+        # Chrome could not start: not a search result, let the caller stop instead of caching "not found"
+        raise
     except Exception as e:
         print(f"Error searching Vuniper for '{title}': {str(e)}")
         return None
+    finally:
+        saved = wait_stats['legacy'] - wait_stats['waited']
+        print(f"Waited {wait_stats['waited']:.1f}s for '{title}' (fixed sleeps: {wait_stats['legacy']:.1f}s, saved {saved:.1f}s)")
+
+def apply_custom_dates(title, vuniper_info, custom_dates=None):
+    """Fill in a missing digital date from digital_dates.txt, or use it when Vuniper found nothing."""
+    if not custom_dates:
+        custom_dates = load_custom_digital_dates()
+    base_title = re.sub(r'\s*\(\d{4}\)', '', title).strip()
+    vuniper_info = dict(vuniper_info) if vuniper_info else None
+
+    # If no digital date from Vuniper, check custom dates file
+    if vuniper_info and not vuniper_info.get('digital_date') and custom_dates:
+        # Try exact matches first, then the most similar title from the index
+        matched_custom_date = custom_dates.exact(base_title)
+        if matched_custom_date:
+            print(f"Exact match found: '{base_title}' = {matched_custom_date}")
+        else:
+            match = custom_dates.best_match(base_title)
+            if match:
+                custom_title, matched_custom_date, score = match
+                print(f"Partial match found: '{custom_title}' -> '{base_title}' = {matched_custom_date} (score {score:.2f})")
+        
+        if matched_custom_date:
+            vuniper_info['digital_date'] = matched_custom_date
+            vuniper_info['source'] = f"{vuniper_info.get('source', 'vuniper')}+custom-dates"
+            print(f"Using custom digital date for '{title}': {matched_custom_date}")
+            
+            # Update status based on custom digital date
+            current_date = datetime.now()
+            try:
+                digital_obj = datetime.strptime(matched_custom_date, "%Y-%m-%d")
+                vuniper_info['status'] = 'Yes' if digital_obj <= current_date else 'Soon'
+            except:
+                vuniper_info['status'] = 'Soon'
+    
+    # If still no info found, try custom dates as fallback
+    if not vuniper_info and custom_dates:
+        # Try exact match first, then the best scoring title (not just the first one sharing a word)
+        matched_custom_date = custom_dates.exact(base_title)
+        if not matched_custom_date:
+            match = custom_dates.best_match(base_title)
+            if match:
+                custom_title, matched_custom_date, score = match
+                print(f"Matched custom date by keywords: '{custom_title}' -> '{title}' = {matched_custom_date} (score {score:.2f})")
+        
+        if matched_custom_date:
+            current_date = datetime.now()
+            try:
+                digital_obj = datetime.strptime(matched_custom_date, "%Y-%m-%d")
+                status = 'Yes' if digital_obj <= current_date else 'Soon'
+            except:
+                status = 'Soon'
+            
+            vuniper_info = {
+                'theater_date': None,
+                'digital_date': matched_custom_date,
+                'status': status,
+                'source': 'custom-dates'
+            }
+            print(f"Using custom date as primary source for '{title}': {matched_custom_date}")
     
-def load_custom_digital_dates():
+    return vuniper_info
+    
+def load_custom_digital_dates(dates_file=None):
     """Load custom digital release dates from a text file."""
-    custom_dates = {}
+    if not dates_file:
+        # Process-wide copy of the configured file, only parsed again after it changed
+        return custom_dates_store.get()
     try:
-        # Look for digital_dates.txt in the same directory as the script
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        dates_file = os.path.join(script_dir, "digital_dates.txt")
-        
-        if os.path.exists(dates_file):
-            with open(dates_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line or line.startswith('#'):  # Skip empty lines and comments
-                        continue
-                    
-                    # Parse format: "Movie Title MONTH DAY" or "Movie Title DAY MONTH" or with year
-                    # Examples: "F1 August 26", "28 Years Later 30 july", "Superman August 26, 2025"
-                    
-                    # Handle comma-separated year first
-                    if ',' in line:
-                        # Format: "Movie Title Month Day, Year"
-                        parts_before_comma = line.split(',')[0].strip().split()
-                        year_part = line.split(',')[1].strip()
-                        
-                        if len(parts_before_comma) >= 3:
-                            title = ' '.join(parts_before_comma[:-2]).strip()
-                            month_str = parts_before_comma[-2]
-                            day_str = parts_before_comma[-1]
-                            year_str = year_part
-                        else:
-                            print(f"Warning: Invalid format on line {line_num}: {line}")
-                            continue
-                    else:
-                        # Format without comma
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            # Check if last part is a year (4 digits)
-                            if len(parts) >= 4 and parts[-1].isdigit() and len(parts[-1]) == 4:
-                                # Format: "Movie Title Month Day Year"
-                                title = ' '.join(parts[:-3]).strip()
-                                month_str = parts[-3]
-                                day_str = parts[-2]
-                                year_str = parts[-1]
-                            else:
-                                # Check if it's "DAY MONTH" format (day first)
-                                if parts[-2].isdigit():
-                                    # Format: "Movie Title DAY MONTH" (assume 2025)
-                                    title = ' '.join(parts[:-2]).strip()
-                                    day_str = parts[-2]
-                                    month_str = parts[-1]
-                                    year_str = "2025"
-                                else:
-                                    # Format: "Movie Title MONTH DAY" (assume 2025)
-                                    title = ' '.join(parts[:-2]).strip()
-                                    month_str = parts[-2]
-                                    day_str = parts[-1]
-                                    year_str = "2025"
-                        else:
-                            print(f"Warning: Invalid format on line {line_num}: {line}")
-                            continue
-                    
-                    # Convert month name to number
-                    month_map = {
-                        'january': '01', 'february': '02', 'march': '03', 'april': '04',
-                        'may': '05', 'june': '06', 'july': '07', 'august': '08',
-                        'september': '09', 'october': '10', 'november': '11', 'december': '12',
-                        'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                        'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                        'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-                    }
-                    
-                    month_num = month_map.get(month_str.lower())
-                    if month_num and day_str.isdigit():
-                        # Format as YYYY-MM-DD
-                        formatted_date = f"{year_str}-{month_num}-{day_str.zfill(2)}"
-                        
-                        # Store multiple variations of the title for better matching
-                        title_variations = [
-                            title.lower(),
-                            title.lower().replace(":", ""),  # Remove colons
-                            title.lower().replace(":", " "),  # Replace colons with spaces
-                        ]
-                        
-                        # Handle "The" prefix variations
-                        if title.lower().startswith("the "):
-                            title_variations.append(title.lower().replace("the ", "").strip())
-                        else:
-                            title_variations.append(f"the {title.lower()}")
-                        
-                        # Store all variations
-                        for variation in title_variations:
-                            custom_dates[variation] = formatted_date
-                        
-                        print(f"Loaded custom date: '{title}' -> {formatted_date}")
-                    else:
-                        print(f"Warning: Could not parse date on line {line_num}: {line}")
-        else:
-            print("No digital_dates.txt file found. Create one in the same directory as this script.")
-            print("Format examples:")
-            print("'Movie Title Month Day' -> 'F1 August 26'")
-            print("'Movie Title Day Month' -> '28 Years Later 30 july'")
-            print("'Movie Title Month Day, Year' -> 'Superman August 26, 2025'")
-    
+        return load_custom_dates(dates_file)
     except Exception as e:
         print(f"Error loading custom digital dates: {str(e)}")
-    
-    return custom_dates
+        return CustomDates()
 
-def extract_vuniper_release_info(driver):
+def extract_vuniper_release_info(driver, wait_stats=None):
     """Extract release information from Vuniper movie page with improved detection."""
     try:
         release_info = {'theater_date': None, 'digital_date': None, 'status': 'TBD'}
         
-        # Wait a bit for page to fully load
-        time.sleep(2)
+        # Wait until the date spans are rendered
+        wait_for(driver, EC.presence_of_element_located((By.XPATH, "//span[@class='semibold']")),
+                 wait_stats, legacy_sleep=2)
         
         # Try multiple selectors for theater release date
         theater_selectors = [
@@ -624,26 +431,7 @@ def extract_vuniper_release_info(driver):
                 pass
         
         # Determine status based on available dates
-        current_date = datetime.now()
-        
-        if release_info['digital_date']:
-            try:
-                digital_obj = datetime.strptime(release_info['digital_date'], "%Y-%m-%d")
-                release_info['status'] = 'Yes' if digital_obj <= current_date else 'Soon'
-            except:
-                release_info['status'] = 'Soon'
-        elif release_info['theater_date']:
-            try:
-                theater_obj = datetime.strptime(release_info['theater_date'], "%Y-%m-%d")
-                # If theater date is in the past but no digital date, it might be available
-                if theater_obj <= current_date:
-                    release_info['status'] = 'No'  # Theater only, but released
-                else:
-                    release_info['status'] = 'No'  # Theater only, not yet released
-            except:
-                release_info['status'] = 'No'
-        else:
-            release_info['status'] = 'TBD'
+        release_info['status'] = release_status(release_info['theater_date'], release_info['digital_date'])
         
         print(f"Final release info: {release_info}")
         return release_info
@@ -652,6 +440,21 @@ def extract_vuniper_release_info(driver):
         print(f"Error extracting release info: {str(e)}")
         return None
 
+def release_status(theater_date, digital_date):
+    """Determine the Vuniper status (Yes/Soon/No/TBD) from the release dates found."""
+    current_date = datetime.now()
+    
+    if digital_date:
+        try:
+            digital_obj = datetime.strptime(digital_date, "%Y-%m-%d")
+            return 'Yes' if digital_obj <= current_date else 'Soon'
+        except:
+            return 'Soon'
+    elif theater_date:
+        # Theater only, whether it is already released or not
+        return 'No'
+    return 'TBD'
+
 def extract_date_from_text(text):
     """Extract date from text in various formats."""
     # Look for patterns like "Jul 15, 2025", "Jun 26, 2025", etc.
@@ -689,16 +492,8 @@ def extract_date_from_text(text):
 
 def search_movie_tmdb(title):
     """Search for movie on TMDb to get poster and description."""
-    url = "https://api.themoviedb.org/3/search/movie"
-    params = {
-        "query": title,
-        "language": HTML_LANGUAGE
-    }
     try:
-        response = requests.get(url, headers=HEADERS, params=params)
-        data = response.json()
-        if data.get("results"):
-            return data["results"][0]
+        return tmdb_client.search_movie(title, HTML_LANGUAGE)
     except Exception as e:
         print(f"TMDb search error for '{title}': {str(e)}")
     return None
@@ -763,52 +558,48 @@ def extract_title(line):
     # Fallback: take the first tab-split section
     return line.split('\t')[0].strip()
 
+RESULT_COLUMNS = [("Title", 40), ("Theater Date", 12), ("Digital Date", 12), ("Status", 12)]
+
+def insert_result_header():
+    """Insert the header line; clicking a column name sorts on that column."""
+    chunks = []
+    for index, (column, width) in enumerate(RESULT_COLUMNS):
+        label = column + sort_marker(sort_columns, column)
+        separator = " | " if index < len(RESULT_COLUMNS) - 1 else "\n"
+        chunks += [f"{label:<{width}}", (f"sort{index}",), separator, ()]
+    output_text.insert(tk.END, *chunks)
+    output_text.insert(tk.END, "-" * 85 + "\n")
+
+def bind_result_header():
+    for index, (column, width) in enumerate(RESULT_COLUMNS):
+        output_text.tag_bind(f"sort{index}", "<Button-1>", lambda event, column=column: sort_by_column(column))
+        output_text.tag_bind(f"sort{index}", "<Enter>", lambda event: output_text.config(cursor="hand2"))
+        output_text.tag_bind(f"sort{index}", "<Leave>", lambda event: output_text.config(cursor=""))
+
+def format_result_line(result):
+    theater_date = result.get('theater_date', 'TBD') or 'TBD'
+    digital_date = result.get('digital_date', 'TBD') or 'TBD'
+    return f"{result['title']:<40} | {theater_date:<12} | {digital_date:<12} | {result['status']:<12}\n"
+
 def display_results(results):
     """Display the results in the output text widget with both theatrical and digital dates."""
     output_text.config(state=tk.NORMAL)
     output_text.delete("1.0", tk.END)
-    
-    output_text.insert(tk.END, f"{'Title':<40} | {'Theater Date':<12} | {'Digital Date':<12} | {'Status':<12}\n")
-    output_text.insert(tk.END, "-" * 85 + "\n")
-    
-    for result in results:
-        theater_date = result.get('theater_date', 'TBD') or 'TBD'
-        digital_date = result.get('digital_date', 'TBD') or 'TBD'
-        
-        output_text.insert(tk.END, f"{result['title']:<40} | {theater_date:<12} | {digital_date:<12} | {result['status']:<12}\n")
-    
+    insert_result_header()
+    output_text.insert(tk.END, "".join(format_result_line(result) for result in results))
     output_text.config(state=tk.DISABLED)
 
-def sort_results():
-    """Sort the results based on the selected criteria."""
+def sort_by_column(column, toggle=True):
+    """Sort on column; the columns sorted on before break ties. Clicking the same header again reverses it."""
+    global sort_columns
     if not movie_results:
         return
-    
-    sort_by = sort_var.get()
-    
-    if sort_by == "Title":
-        sorted_results = sorted(movie_results, key=lambda x: x['title'].lower())
-    elif sort_by == "Theater Date":
-        def date_sort_key(x):
-            date = x.get('theater_date', 'TBD')
-            if date == "TBD" or date == "-":
-                return "9999-12-31"
-            return date
-        sorted_results = sorted(movie_results, key=date_sort_key)
-    elif sort_by == "Digital Date":
-        def date_sort_key(x):
-            date = x.get('digital_date', 'TBD')
-            if date == "TBD" or date == "-":
-                return "9999-12-31"
-            return date
-        sorted_results = sorted(movie_results, key=date_sort_key)
-    elif sort_by == "Downloadable":
-        status_order = {"Yes": 1, "Soon": 2, "TBD": 3, "No": 4}
-        sorted_results = sorted(movie_results, key=lambda x: status_order.get(x['status'], 5))
-    else:
-        sorted_results = movie_results
-    
-    display_results(sorted_results)
+    sort_columns = choose_sort_column(sort_columns, column, toggle)
+    display_results(sort_results_by(movie_results, sort_columns))
+
+def sort_results():
+    """Sort the results based on the selected criteria."""
+    sort_by_column(sort_var.get(), toggle=False)
 
 def load_from_ombi_db():
     try:
@@ -826,38 +617,77 @@ def load_from_ombi_db():
         input_text.insert(tk.END, "\n".join(pending_lines))
 
 def check_movies():
+    """Start checking the pasted movies on a background thread; results show up as they come in."""
     global movie_results
+    if check_worker.running:
+        return
+
+    lines = [line for line in input_text.get("1.0", tk.END).strip().split('\n') if extract_title(line)]
+    if not lines:
+        output_text.config(state=tk.NORMAL)
+        output_text.delete("1.0", tk.END)
+        output_text.insert(tk.END, "Please paste some movie data.\n")
+        output_text.config(state=tk.DISABLED)
+        return
+
     movie_results = []
-    
     output_text.config(state=tk.NORMAL)
     output_text.delete("1.0", tk.END)
-    output_text.insert(tk.END, "Initializing web browser...\n")
+    insert_result_header()
     output_text.config(state=tk.DISABLED)
-    output_text.update()
-    
+    progress_bar.config(maximum=len(lines), value=0)
+    progress_var.set("Initializing web browser...")
+    check_button.config(state=tk.DISABLED)
+    cancel_button.config(state=tk.NORMAL)
+    check_worker.start(check_movies_worker, lines)
+
+def cancel_check():
+    if check_worker.running:
+        check_worker.cancel()
+        progress_var.set("Cancelling after the current movie...")
+
+def handle_check_event(kind, payload):
+    """Apply an event from the check worker to the GUI (runs on the Tk thread)."""
+    if kind == "progress":
+        current_movie, total_movies, label = payload
+        progress_var.set(f"Processing movie {current_movie}/{total_movies}: {label}")
+    elif kind == "result":
+        movie_results.append(payload)
+        progress_bar.config(value=len(movie_results))
+        output_text.config(state=tk.NORMAL)
+        output_text.insert(tk.END, format_result_line(payload))
+        output_text.config(state=tk.DISABLED)
+    elif kind == "error":
+        messagebox.showerror("Error", payload)
+    elif kind == "done":
+        total_movies = int(float(progress_bar.cget("maximum")))
+        if payload:
+            progress_var.set(f"Cancelled: {len(movie_results)}/{total_movies} movies checked")
+        else:
+            progress_var.set(f"Done: {len(movie_results)} movies checked")
+        check_button.config(state=tk.NORMAL)
+        cancel_button.config(state=tk.DISABLED)
+
+def check_movies_worker(worker, lines):
+    """The check loop, run by check_worker off the Tk thread. Never touches Tk widgets."""
     # Setup Selenium driver
-    driver = setup_selenium_driver()
+    driver = setup_selenium_driver(show_errors=False)
     if not driver:
+        worker.post("error", "Failed to initialize Chrome WebDriver. Please ensure Chrome and ChromeDriver are installed.")
         return
     
+    tmdb_prefetcher = TMDbPrefetcher(tmdb_client, HTML_LANGUAGE)
     try:
-        lines = input_text.get("1.0", tk.END).strip().split('\n')
-        
-        if not lines:
-            output_text.config(state=tk.NORMAL)
-            output_text.insert(tk.END, "Please paste some movie data.\n")
-            output_text.config(state=tk.DISABLED)
-            return
-        
-        total_movies = len([line for line in lines if extract_title(line)])
-        current_movie = 0
+        total_movies = len(lines)
         
+        # Start all TMDb lookups right away, they run while Vuniper is being scraped
         for line in lines:
+            tmdb_prefetcher.submit(extract_title(line))
+        
+        for current_movie, line in enumerate(lines, 1):
+            if worker.cancelled.is_set():
+                break
             title = extract_title(line)
-            if not title:
-                continue
-            
-            current_movie += 1
             
             # Extract year from the original line if available
             expected_year = None
@@ -877,17 +707,13 @@ def check_movies():
             
             # Update progress with year info if available
             year_info = f" ({expected_year})" if expected_year else ""
-            output_text.config(state=tk.NORMAL)
-            output_text.delete("1.0", tk.END)
-            output_text.insert(tk.END, f"Processing movie {current_movie}/{total_movies}: {title}{year_info}\n")
-            output_text.config(state=tk.DISABLED)
-            output_text.update()
+            worker.post("progress", (current_movie, total_movies, f"{title}{year_info}"))
             
             # Search Vuniper for release info with year information
             vuniper_info = search_movie_vuniper(title, driver, expected_year=expected_year)
             
-            # Search TMDb for poster and description
-            tmdb_data = search_movie_tmdb(title)
+            # Get the (prefetched) TMDb poster and description
+            tmdb_data = tmdb_prefetcher.get(title)
             
             # If TMDb found a different year, log it for debugging
             if tmdb_data and expected_year:
@@ -921,7 +747,7 @@ def check_movies():
                 overview = tmdb_data.get('overview', 'No description available.')
                 movie_id = tmdb_data.get('id')
             
-            movie_results.append({
+            worker.post("result", add_sort_keys({
                 'title': title,
                 'theater_date': theater_date,
                 'digital_date': digital_date,
@@ -931,19 +757,15 @@ def check_movies():
                 'movie_id': movie_id,
                 'vuniper_url': vuniper_url,
                 'expected_year': expected_year
-            })
-            
-            # Add delay between requests to be respectful
-            time.sleep(2)
-        
-        display_results(movie_results)
+            }))
         
     finally:
+        tmdb_prefetcher.close()
         driver.quit()
 
 def open_settings_window():
     """Open a settings window for HTML customization."""
-    global USE_CUSTOM_BACKGROUND, CUSTOM_BACKGROUND_URL, HTML_LANGUAGE, OMBI_SITE_URL, TMDB_BEARER_TOKEN, HEADERS
+    global USE_CUSTOM_BACKGROUND, CUSTOM_BACKGROUND_URL, HTML_LANGUAGE, OMBI_SITE_URL, TMDB_BEARER_TOKEN
     
     settings_window = tk.Toplevel(window)
     settings_window.title("HTML Report Settings")
@@ -1062,7 +884,7 @@ def open_settings_window():
     button_frame.pack(fill="x", pady=(20, 0))
     
     def save_settings():
-        global USE_CUSTOM_BACKGROUND, CUSTOM_BACKGROUND_URL, HTML_LANGUAGE, OMBI_SITE_URL, TMDB_BEARER_TOKEN, HEADERS
+        global USE_CUSTOM_BACKGROUND, CUSTOM_BACKGROUND_URL, HTML_LANGUAGE, OMBI_SITE_URL, TMDB_BEARER_TOKEN
         
         # Validate TMDb token
         new_token = tmdb_token_var.get().strip()
@@ -1077,11 +899,7 @@ def open_settings_window():
         OMBI_SITE_URL = ombi_url_var.get().rstrip('/')  # Remove trailing slash
         TMDB_BEARER_TOKEN = new_token
         
-        # Update headers with new token
-        HEADERS = {
-            "Authorization": f"Bearer {TMDB_BEARER_TOKEN}",
-            "accept": "application/json"
-        }
+        tmdb_client.set_token(TMDB_BEARER_TOKEN)
         
         messagebox.showinfo("Settings Saved", "Settings have been saved successfully!")
         settings_window.destroy()
@@ -1116,551 +934,388 @@ def generate_html_report():
     if not file_path:
         return
     
-    # Generate HTML content
-    html_content = generate_html_content()
-    
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        write_report(file_path, movie_results, **html_report_options())
         messagebox.showinfo("Success", f"HTML report saved to:\n{file_path}")
     except Exception as e:
         messagebox.showerror("Error", f"Failed to save HTML report:\n{str(e)}")
 
+def html_report_options():
+    """Report settings from the (GUI-editable) globals, for html_report."""
+    use_background = USE_CUSTOM_BACKGROUND.lower() == "yes" and CUSTOM_BACKGROUND_URL
+    return {
+        'background_url': CUSTOM_BACKGROUND_URL if use_background else None,
+        'ombi_site_url': OMBI_SITE_URL,
+    }
+
 def generate_html_content():
     """Generate the HTML content for the movie report."""
-    current_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-    
-    # Calculate statistics
-    total_movies = len(movie_results)
-    available_count = len([m for m in movie_results if m['status'] == 'Yes'])
-    soon_count = len([m for m in movie_results if m['status'] == 'Soon'])
-    unavailable_count = len([m for m in movie_results if m['status'] in ['No', 'TBD']])
-    
-    # Determine background style
-    if USE_CUSTOM_BACKGROUND.lower() == "yes" and CUSTOM_BACKGROUND_URL:
-        background_style = f"""
-            background: url('{CUSTOM_BACKGROUND_URL}') center center fixed;
-            background-size: cover;
-        """
-        # Add overlay for better readability
-        overlay_style = """
-        body::before {
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.3);
-            z-index: -1;
+    return "".join(iter_report_html(movie_results, **html_report_options()))
+
+import argparse
+
+class RequestChecker:
+    """Everything needed to check Ombi requests, kept warm between batches (driver pool, HTTP client, cache, state)."""
+
+    def __init__(self, args):
+        self.args = args
+        self.state = CheckState(args.state_db)
+        self.results = ResultStore(args.results_db)
+        self.writers = []  # ResultWriters for --output-jsonl/json/csv
+        self.report_cache = ReportCache(args.report_cache_db) if args.output_html else None
+        self.poster_cache = PosterCache(args.poster_dir) if args.output_html and args.poster_dir else None
+        self.cache = None if args.no_cache else VuniperCache(args.cache_db)
+        # Chrome wordt pas gestart als er echt iets gescraped moet worden
+        self.pool = DriverPool(lambda: setup_selenium_driver(show_errors=False), args.workers)
+        self.http_client = (VuniperHttpClient(vuniper_rate_limiter, pool_size=args.workers)
+                            if args.backend == "http" else None)
+
+    def iter_due(self, movie_requests, full=False, seen_ids=None):
+        """Yield the requests that are new or due again, as they come in. Collects all Ids in seen_ids."""
+        for request in movie_requests:
+            if seen_ids is not None:
+                seen_ids.append(request.request_id)
+            reason = "full run" if full else self.state.due_reason(request)
+            if reason:
+                if self.args.debug:
+                    print(f"Te controleren: {request.title} ({reason})")
+                yield request
+
+    def select_due(self, movie_requests, full=False, forget_missing=True):
+        """Requests that are new or due again; forgets requests that are no longer pending."""
+        if forget_missing:
+            self.state.forget_missing(request.request_id for request in movie_requests)
+        return list(self.iter_due(movie_requests, full))
+
+    def check_request(self, idx, total, request, custom_dates, tmdb_prefetcher):
+        title = request.title
+        print(f"[{idx}/{total}] Verwerk: {title}" if total else f"[{idx}] Verwerk: {title}")
+        start = time.monotonic()
+        
+        # Jaartal uit de titel ("Movie (2025)"), anders uit de releasedatum in Ombi
+        year_match = re.search(r'\((\d{4})\)', title)
+        expected_year = int(year_match.group(1)) if year_match else request.year
+
+        # Alleen het Vuniper resultaat wordt gecached; digital_dates.txt komt er elke keer opnieuw overheen
+        hit, vuniper_info = self.cache.lookup(title, expected_year) if self.cache else (False, None)
+        if hit:
+            print(f"Cache hit: {vuniper_info}")
+        else:
+            driver = PooledDriver(self.pool)
+            try:
+                vuniper_info = search_vuniper(title, driver, expected_year=expected_year,
+                                              http_client=self.http_client)
+            finally:
+                driver.release()
+            if self.cache:
+                self.cache.store(title, expected_year, vuniper_info)
+        vuniper_info = apply_custom_dates(title, vuniper_info, custom_dates)
+        if hit:
+            source = "cache+custom-dates" if vuniper_info and "custom-dates" in vuniper_info.get("source", "") else "cache"
+        else:
+            source = vuniper_info.get("source", "vuniper") if vuniper_info else None
+        tmdb_data = tmdb_prefetcher.get(title, request.tmdb_id)
+
+        # Geen digitale datum van Vuniper: gebruik de digitale release uit TMDb
+        tmdb_digital = digital_release_date(tmdb_data)
+        if tmdb_digital and not (vuniper_info and vuniper_info.get("digital_date")):
+            print(f"Using TMDb digital release date for '{title}': {tmdb_digital}")
+            vuniper_info = dict(vuniper_info or {'theater_date': None},
+                                digital_date=tmdb_digital,
+                                status=release_status(None, tmdb_digital))
+            source = "tmdb"
+
+        result = {
+            "title": title,
+            "theater_date": vuniper_info.get("theater_date") if vuniper_info else "TBD",
+            "digital_date": vuniper_info.get("digital_date") if vuniper_info else "TBD",
+            "status": determine_downloadable_status(
+                vuniper_info,
+                vuniper_info.get("theater_date") if vuniper_info else None,
+                vuniper_info.get("digital_date") if vuniper_info else None
+            ),
+            "poster_url": "",
+            "overview": "Geen beschrijving beschikbaar.",
+            "movie_id": request.tmdb_id or (tmdb_data.get("id") if tmdb_data else None),
+            "vuniper_url": vuniper_info.get("vuniper_url") if vuniper_info else None,
+            "source": source or "none",
         }
+
+        if tmdb_data:
+            poster_path = tmdb_data.get("poster_path")
+            if poster_path:
+                result["poster_url"] = f"https://image.tmdb.org/t/p/w500{poster_path}"
+            result["overview"] = tmdb_data.get("overview", result["overview"])
+
+        result["elapsed"] = round(time.monotonic() - start, 3)
+        return result
+
+    def check(self, due_requests, mode="cli"):
+        """Check requests (a list or a stream) and record the results. Returns the checked request Ids.
+
+        Raises RuntimeError when Chrome cannot start.
         """
-    else:
-        background_style = "background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);"
-        overlay_style = ""
-    
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Movie Download Status Report</title>
-    <link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>🎬</text></svg>">
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            {background_style}
-            min-height: 100vh;
-        }}
-        {overlay_style}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 15px;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.3);
-            overflow: hidden;
-            position: relative;
-            z-index: 1;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #2c3e50 0%, #34495e 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-        }}
-        .header p {{
-            margin: 10px 0 0 0;
-            opacity: 0.8;
-            font-size: 1.1em;
-        }}
-        .stats {{
-            display: flex;
-            justify-content: space-around;
-            padding: 20px;
-            background: #f8f9fa;
-            border-bottom: 1px solid #dee2e6;
-        }}
-        .stat {{
-            text-align: center;
-            cursor: pointer;
-            padding: 10px;
-            border-radius: 8px;
-            transition: all 0.3s ease;
-            user-select: none;
-        }}
-        .stat:hover {{
-            background: rgba(0,0,0,0.05);
-            transform: translateY(-2px);
-        }}
-        .stat.active {{
-            background: rgba(0,123,255,0.1);
-            border: 2px solid #007bff;
-        }}
-        .stat-number {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #2c3e50;
-        }}
-        .stat-label {{
-            color: #6c757d;
-            font-size: 0.9em;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-        .filter-info {{
-            text-align: center;
-            padding: 10px 20px;
-            background: #e3f2fd;
-            color: #1976d2;
-            font-weight: bold;
-            display: none;
-        }}
-        .movies-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
-            gap: 20px;
-            padding: 30px;
-        }}
-        .movie-card {{
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            overflow: hidden;
-            transition: transform 0.3s ease, box-shadow 0.3s ease;
-            text-decoration: none;
-            color: inherit;
-            display: block;
-        }}
-        .movie-card:hover {{
-            transform: translateY(-5px);
-            box-shadow: 0 8px 25px rgba(0,0,0,0.2);
-        }}
-        .movie-card.hidden {{
-            display: none;
-        }}
-        .movie-poster {{
-            width: 100%;
-            height: 400px;
-            object-fit: cover;
-            background: linear-gradient(45deg, #f0f0f0 25%, transparent 25%), 
-                        linear-gradient(-45deg, #f0f0f0 25%, transparent 25%), 
-                        linear-gradient(45deg, transparent 75%, #f0f0f0 75%), 
-                        linear-gradient(-45deg, transparent 75%, #f0f0f0 75%);
-            background-size: 20px 20px;
-            background-position: 0 0, 0 10px, 10px -10px, -10px 0px;
-        }}
-        .movie-info {{
-            padding: 20px;
-        }}
-        .movie-title {{
-            font-size: 1.2em;
-            font-weight: bold;
-            margin-bottom: 10px;
-            color: #2c3e50;
-            line-height: 1.3;
-        }}
-        .movie-overview {{
-            color: #6c757d;
-            font-size: 0.9em;
-            line-height: 1.4;
-            margin-bottom: 15px;
-            display: -webkit-box;
-            -webkit-line-clamp: 3;
-            -webkit-box-orient: vertical;
-            overflow: hidden;
-        }}
-        .movie-meta {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-        }}
-        .release-date {{
-            background: #e9ecef;
-            padding: 5px 10px;
-            border-radius: 15px;
-            font-size: 0.8em;
-            color: #495057;
-        }}
-        .status-badge {{
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 0.9em;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        .status-yes {{
-            background: #d4edda;
-            color: #155724;
-            border: 1px solid #c3e6cb;
-        }}
-        .status-soon {{
-            background: #fff3cd;
-            color: #856404;
-            border: 1px solid #ffeaa7;
-        }}
-        .status-no {{
-            background: #f8d7da;
-            color: #721c24;
-            border: 1px solid #f5c6cb;
-        }}
-        .status-tbd {{
-            background: #e2e3e5;
-            color: #383d41;
-            border: 1px solid #d6d8db;
-        }}
-        .ombi-link {{
-            display: inline-block;
-            background: #007bff;
-            color: white;
-            padding: 8px 16px;
-            border-radius: 5px;
-            text-decoration: none;
-            font-size: 0.9em;
-            font-weight: bold;
-            transition: background-color 0.3s ease;
-            margin-right: 8px;
-        }}
-        .ombi-link:hover {{
-            background: #0056b3;
-            color: white;
-            text-decoration: none;
-        }}
-        .vuniper-link {{
-            display: inline-block;
-            background: #28a745;
-            color: white;
-            padding: 8px 16px;
-            border-radius: 5px;
-            text-decoration: none;
-            font-size: 0.9em;
-            font-weight: bold;
-            transition: background-color 0.3s ease;
-        }}
-        .vuniper-link:hover {{
-            background: #1e7e34;
-            color: white;
-            text-decoration: none;
-        }}
-        .footer {{
-            text-align: center;
-            padding: 20px;
-            background: #f8f9fa;
-            color: #6c757d;
-            font-size: 0.9em;
-        }}
-        .footer a {{
-            color: #007bff;
-            text-decoration: none;
-        }}
-        .footer a:hover {{
-            text-decoration: underline;
-        }}
-        @media (max-width: 768px) {{
-            .movies-grid {{
-                grid-template-columns: 1fr;
-                padding: 15px;
-            }}
-            .stats {{
-                flex-direction: column;
-                gap: 15px;
-            }}
-            .header h1 {{
-                font-size: 2em;
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🎬 Movie Download Status Report</h1>
-            <p>Generated on {current_date}</p>
-        </div>
-        
-        <div class="stats">
-            <div class="stat" data-filter="all" onclick="filterMovies('all')">
-                <div class="stat-number">{total_movies}</div>
-                <div class="stat-label">Total Movies</div>
-            </div>
-            <div class="stat" data-filter="yes" onclick="filterMovies('yes')">
-                <div class="stat-number" style="color: #28a745;">{available_count}</div>
-                <div class="stat-label">Available Now</div>
-            </div>
-            <div class="stat" data-filter="soon" onclick="filterMovies('soon')">
-                <div class="stat-number" style="color: #ffc107;">{soon_count}</div>
-                <div class="stat-label">Coming Soon</div>
-            </div>
-            <div class="stat" data-filter="unavailable" onclick="filterMovies('unavailable')">
-                <div class="stat-number" style="color: #dc3545;">{unavailable_count}</div>
-                <div class="stat-label">Not Available</div>
-            </div>
-        </div>
-        
-        <div class="filter-info" id="filterInfo">
-            Showing all movies
-        </div>
-        
-        <div class="movies-grid" id="moviesGrid">"""
-    
-    # Generate movie cards
-    for movie in movie_results:
-        # Determine status class and text
-        status_class = f"status-{movie['status'].lower()}"
-        if movie['status'] == 'TBD':
-            status_class = "status-tbd"
-        
-        # Determine filter category
-        if movie['status'] == 'Yes':
-            filter_category = 'yes'
-        elif movie['status'] == 'Soon':
-            filter_category = 'soon'
-        else:  # 'No' or 'TBD'
-            filter_category = 'unavailable'
-        
-        # Format dates for display
-        theater_date = movie.get('theater_date', 'TBD')
-        digital_date = movie.get('digital_date', 'TBD')
-        
-        if theater_date == 'TBD':
-            theater_date = 'TBD'
-        if digital_date == 'TBD':
-            digital_date = 'TBD'
-        
-        # Generate links HTML
-        links_html = ""
-        if OMBI_SITE_URL and movie.get('movie_id'):
-            ombi_url = f"{OMBI_SITE_URL}/details/movie/{movie['movie_id']}"
-            links_html += f'<a href="{ombi_url}" class="ombi-link" target="_blank">Ombi</a>'
-
-        if movie.get('vuniper_url'):
-            links_html += f'<a href="{movie["vuniper_url"]}" class="vuniper-link" target="_blank">Vuniper</a>'
-        
-        # Generate movie card HTML
-        html += f"""
-            <div class="movie-card" data-filter="{filter_category}">
-                <img src="{movie['poster_url']}" alt="{movie['title']} Poster" class="movie-poster" 
-                     onerror="this.style.display='none';">
-                <div class="movie-info">
-                    <div class="movie-title">{movie['title']}</div>
-                    <div class="movie-overview">{movie['overview']}</div>
-                    <div class="movie-meta">
-                        <div style="display: flex; flex-direction: column; gap: 5px;">
-                            <span class="release-date">🎭 Theater: {theater_date}</span>
-                            <span class="release-date">💿 Digital: {digital_date}</span>
-                        </div>
-                        <span class="status-badge {status_class}">{movie['status']}</span>
-                    </div>
-                    {links_html}
-                </div>
-            </div>"""
-    
-    html += f"""
-        </div>
-        
-        <div class="footer">
-            <p>Generated by ombicheck.py | Data from The Movie Database (TMDb) and Vuniper | <a href="https://github.com/WilmeRWubS/OmbiChecker" target="_blank" rel="noopener noreferrer">https://github.com/WilmeRWubS/OmbiChecker</a></p>
-        </div>
-    </div>
-    
-    <script>
-        let currentFilter = 'all';
-        
-        function filterMovies(filter) {{
-            currentFilter = filter;
-            const movieCards = document.querySelectorAll('.movie-card');
-            const filterInfo = document.getElementById('filterInfo');
-            const stats = document.querySelectorAll('.stat');
-            
-            // Remove active class from all stats
-            stats.forEach(stat => stat.classList.remove('active'));
-            
-            // Add active class to clicked stat
-            document.querySelector(`[data-filter="${{filter}}"]`).classList.add('active');
-            
-            // Show/hide movies based on filter
-            movieCards.forEach(card => {{
-                if (filter === 'all') {{
-                    card.classList.remove('hidden');
-                }} else {{
-                    const cardFilter = card.getAttribute('data-filter');
-                    if (cardFilter === filter) {{
-                        card.classList.remove('hidden');
-                    }} else {{
-                        card.classList.add('hidden');
-                    }}
-                }}
-            }});
-            
-            // Update filter info
-            const visibleCards = document.querySelectorAll('.movie-card:not(.hidden)').length;
-            let filterText = '';
-            
-            switch(filter) {{
-                case 'all':
-                    filterText = `Showing all {total_movies} movies`;
-                    filterInfo.style.display = 'none';
-                    break;
-                case 'yes':
-                    filterText = `Showing ${{visibleCards}} available movies`;
-                    filterInfo.style.display = 'block';
-                    break;
-                case 'soon':
-                    filterText = `Showing ${{visibleCards}} movies coming soon`;
-                    filterInfo.style.display = 'block';
-                    break;
-                case 'unavailable':
-                    filterText = `Showing ${{visibleCards}} unavailable movies`;
-                    filterInfo.style.display = 'block';
-                    break;
-            }}
-            
-            filterInfo.textContent = filterText;
-        }}
-        
-        // Initialize with all movies shown
-        document.addEventListener('DOMContentLoaded', function() {{
-            filterMovies('all');
-        }});
-    </script>
-</body>
-</html>"""
-    
-    return html
+        custom_dates = custom_dates_store.get()
+        tmdb_prefetcher = TMDbPrefetcher(tmdb_client, HTML_LANGUAGE)
+        total = len(due_requests) if isinstance(due_requests, list) else None
 
-import argparse
+        def prefetched(movie_requests):
+            # The TMDb lookup starts as soon as a request comes in, ahead of the scraper
+            for idx, request in enumerate(movie_requests, 1):
+                tmdb_prefetcher.submit(request.title, request.tmdb_id)
+                yield idx, request
+
+        run_id = self.results.start_run(mode)
+        checked = []
+        try:
+            results = map_in_order(
+                lambda item: (item[1], self.check_request(item[0], total, item[1], custom_dates, tmdb_prefetcher)),
+                prefetched(due_requests), self.args.workers)
+            for request, result in results:
+                self.state.record(request, result)
+                self.results.record(run_id, request, result)
+                for writer in self.writers:
+                    writer.write(request.request_id, result)
+                checked.append(request.request_id)
+        finally:
+            tmdb_prefetcher.close()
+            self.results.finish_run(run_id, len(checked))
+        return checked
+
+    def close(self):
+        self.pool.close()
+        if self.http_client:
+            self.http_client.close()
+        if self.cache:
+            print(f"\nCache: {self.cache.hits} hits, {self.cache.misses} misses")
+            self.cache.close()
+        print(f"TMDb: {tmdb_client.stats()}")
+        self.state.close()
+        self.results.close()
+        if self.report_cache:
+            self.report_cache.close()
+        if self.poster_cache:
+            print(f"Posters: {self.poster_cache.stats()}")
+            self.poster_cache.close()
+
+def report_results(state, request_ids, output_html=None, report_cache=None, poster_cache=None):
+    """Print the summary for all requests (skipped ones with their previous result) and write the HTML report."""
+    # Overgeslagen verzoeken krijgen hun vorige resultaat
+    results = [state.previous_result(request_id) for request_id in request_ids]
+    results = [result for result in results if result]
+
+    # Toon CLI overzicht
+    print("\nResultaten:")
+    for r in results:
+        print(f"{r['title']}: {r['status']} - Digital: {r['digital_date']}")
+
+    # Optioneel HTML rapport
+    global movie_results
+    movie_results = results
+    if output_html:
+        try:
+            if poster_cache:
+                # Kaarten verwijzen naar de lokale posters in plaats van naar TMDb
+                movie_results = poster_cache.localize(results, output_html)
+            if write_report(output_html, movie_results, cache=report_cache, **html_report_options()):
+                print(f"\n✅ HTML rapport opgeslagen als: {output_html}")
+            else:
+                print(f"\nHTML rapport ongewijzigd: {output_html}")
+        except Exception as e:
+            print(f"❌ Fout bij opslaan van HTML: {e}")
+
+def run_daemon(checker, args):
+    """Keep running: check new Ombi requests as soon as they appear, and due ones every recheck interval."""
+    request_filter = request_filter_from_args(args)
+    try:
+        watcher = RequestWatcher(args.ombi_db, request_filter)
+    except sqlite3.Error as e:
+        print(f"Database error: {e}")
+        return
+    last_sweep = None
+    print(f"Daemon gestart: database elke {args.poll_interval:g}s bekeken, "
+          f"volledige controle elke {args.recheck_interval:g}s. Stop met Ctrl+C.")
+    try:
+        while True:
+            try:
+                if last_sweep is None or time.time() - last_sweep >= args.recheck_interval:
+                    movie_requests = watcher.sweep()
+                    due_requests = checker.select_due(movie_requests, full=args.full and last_sweep is None,
+                                                      forget_missing=request_filter.is_default())
+                    print(f"{len(movie_requests)} films gevonden, {len(due_requests)} te controleren.")
+                    if due_requests:
+                        checker.check(due_requests, mode="daemon-sweep")
+                    last_sweep = time.time()
+                    if due_requests:
+                        report_results(checker.state, [r.request_id for r in movie_requests], args.output_html,
+                                       checker.report_cache, checker.poster_cache)
+                elif watcher.changed():
+                    new_requests = watcher.new_requests()
+                    if new_requests:
+                        print(f"{len(new_requests)} nieuwe verzoek(en): {', '.join(r.title for r in new_requests)}")
+                        checker.check(new_requests, mode="daemon-new")
+                        report_results(checker.state, [r.request_id for r in watcher.pending()], args.output_html,
+                                       checker.report_cache, checker.poster_cache)
+            except RuntimeError as e:
+                print(f"WebDriver error: {e}")
+            except Exception as e:
+                print(f"Daemon error: {e}")
+            time.sleep(args.poll_interval)
+    except KeyboardInterrupt:
+        print("\nDaemon gestopt.")
+    finally:
+        watcher.close()
+
+def iso_date(value):
+    """argparse type for YYYY-MM-DD dates."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ongeldige datum '{value}', gebruik YYYY-MM-DD")
+
+def request_filter_from_args(args):
+    return RequestFilter(
+        approval=args.approval,
+        quality=args.quality,
+        users=args.user,
+        requested_from=args.requested_from,
+        requested_to=args.requested_to,
+        released_from=args.released_from,
+        released_to=args.released_to,
+    )
 
 def run_cli():
     parser = argparse.ArgumentParser(description="Movie Download Checker CLI")
     parser.add_argument("--ombi-db", help="Path to Ombi SQLite database (ombi.db)", default="ombi.db")
     parser.add_argument("--tmdb-token", help="TMDb Bearer Token", required=True)
     parser.add_argument("--language", help="TMDb language code (e.g., nl-NL)", default="nl-NL")
-    parser.add_argument("--custom-dates", help="Path to digital_dates.txt", default="digital_dates.txt")
+    parser.add_argument("--custom-dates", help="Path to digital_dates.txt (default: next to this script)")
     parser.add_argument("--output-html", help="Path to save HTML report", required=False)
+    parser.add_argument("--report-cache-db", help="Path to the cache of rendered HTML report cards",
+                        default="ombicheck_report_cache.db")
+    parser.add_argument("--poster-dir", help="Store the report posters in this directory instead of linking to TMDb")
+    parser.add_argument("--cache-db", help="Path to the Vuniper result cache", default="vuniper_cache.db")
+    parser.add_argument("--no-cache", action="store_true", help="Always scrape Vuniper, ignore cached results")
+    parser.add_argument("--workers", type=int, default=1, help="Number of parallel Chrome drivers")
+    parser.add_argument("--rate-limit", type=float, default=VUNIPER_REQUESTS_PER_SECOND,
+                        help="Max requests per second to Vuniper, shared by all workers")
+    parser.add_argument("--backend", choices=["http", "selenium"], default="http",
+                        help="Vuniper backend: plain HTTP with Selenium fallback, or Selenium only")
+    parser.add_argument("--state-db", help="Path to the database that remembers earlier checks", default="ombicheck_state.db")
+    parser.add_argument("--results-db", help="Path to the database that keeps every run's results",
+                        default="ombicheck_results.db")
+    parser.add_argument("--full", action="store_true", help="Check every request, not only the ones that are due")
+    parser.add_argument("--approval", choices=RequestFilter.APPROVALS, default="pending",
+                        help="Check pending (default), approved or all requests that are not available yet")
+    parser.add_argument("--quality", choices=RequestFilter.QUALITIES, default="hd",
+                        help="Check normal requests (default), 4K requests or both")
+    parser.add_argument("--user", action="append", help="Only requests from this Ombi user (can be repeated)")
+    parser.add_argument("--requested-from", type=iso_date, help="Only requests made on or after YYYY-MM-DD")
+    parser.add_argument("--requested-to", type=iso_date, help="Only requests made on or before YYYY-MM-DD")
+    parser.add_argument("--released-from", type=iso_date, help="Only movies released on or after YYYY-MM-DD")
+    parser.add_argument("--released-to", type=iso_date, help="Only movies released on or before YYYY-MM-DD")
+    parser.add_argument("--daemon", action="store_true", help="Keep running and check new requests as they arrive")
+    parser.add_argument("--poll-interval", type=float, default=10,
+                        help="Daemon: seconds between checks of the Ombi database")
+    parser.add_argument("--recheck-interval", type=float, default=3600,
+                        help="Daemon: seconds between re-checks of requests that are due")
     parser.add_argument("--debug", action="store_true", help="Enable debug output")
+    parser.add_argument("--output-jsonl", help="Write one JSON line per result as soon as it is known ('-' for stdout)")
+    parser.add_argument("--output-json", help="Write the results as a JSON array ('-' for stdout)")
+    parser.add_argument("--output-csv", help="Write the results as CSV ('-' for stdout)")
     args = parser.parse_args()
 
+    writers = []
+    try:
+        for fmt in FORMATS:
+            path = getattr(args, f"output_{fmt}")
+            if path:
+                writers.append(ResultWriter(path, fmt))
+    except OSError as e:
+        print(f"❌ Kan uitvoerbestand niet openen: {e}")
+        return
+
+    # Resultaten op stdout: de voortgangsmeldingen gaan dan naar stderr
+    log = contextlib.redirect_stdout(sys.stderr) if any(w.path == "-" for w in writers) else contextlib.nullcontext()
+    try:
+        with log:
+            run_checks(args, writers)
+    finally:
+        for writer in writers:
+            writer.close()
+
+def run_checks(args, writers):
+    """Everything run_cli does after parsing the arguments."""
     # Set globals based on CLI args
-    global TMDB_BEARER_TOKEN, HTML_LANGUAGE, HEADERS
+    global TMDB_BEARER_TOKEN, HTML_LANGUAGE
     TMDB_BEARER_TOKEN = args.tmdb_token
     HTML_LANGUAGE = args.language
-    HEADERS = {
-        "Authorization": f"Bearer {TMDB_BEARER_TOKEN}",
-        "accept": "application/json"
-    }
+    tmdb_client.set_token(TMDB_BEARER_TOKEN)
+
+    if args.custom_dates:
+        custom_dates_store.set_path(args.custom_dates)
+
+    global vuniper_rate_limiter
+    vuniper_rate_limiter = RateLimiter(args.rate_limit)
+
+    if args.daemon:
+        checker = RequestChecker(args)
+        checker.writers = writers
+        try:
+            run_daemon(checker, args)
+        finally:
+            checker.close()
+        return
 
-    # Fetch movie lines from database
     try:
         conn = connect_db(args.ombi_db)
-        lines = get_pending_requests(conn)
-        conn.close()
     except Exception as e:
         print(f"Database error: {e}")
         return
 
-    if not lines:
-        print("Geen openstaande filmverzoeken gevonden in de Ombi-database.")
-        return
-
-    print(f"{len(lines)} films gevonden. Start met controleren...\n")
-
-    custom_dates = load_custom_digital_dates()  # automatisch pakt hij digital_dates.txt
-    driver = setup_selenium_driver()
-    if not driver:
-        return
-
-    results = []
+    # Verzoeken worden gecontroleerd terwijl ze uit de database komen; alleen nieuwe of weer aan de beurt
+    request_filter = request_filter_from_args(args)
+    checker = RequestChecker(args)
+    checker.writers = writers
+    # Ook bij Ctrl+C of een onverwachte fout worden alle Chrome drivers afgesloten
     try:
-        for idx, line in enumerate(lines, 1):
-            title = extract_title(line)
-            print(f"[{idx}/{len(lines)}] Verwerk: {title}")
-            
-            # Extract expected year
-            expected_year = None
-            year_match = re.search(r'\((\d{4})\)', title)
-            if year_match:
-                expected_year = int(year_match.group(1))
-            else:
-                # Fallback: zoek naar een jaartal ergens in de regel
-                year_match = re.search(r'(\d{4})', line)
-                if year_match:
-                    potential_year = int(year_match.group(1))
-                    if 1900 <= potential_year <= 2035:
-                        expected_year = potential_year
-
-            vuniper_info = search_movie_vuniper(title, driver, custom_dates, expected_year=expected_year)
-            tmdb_data = search_movie_tmdb(title)
-
-            result = {
-                "title": title,
-                "theater_date": vuniper_info.get("theater_date") if vuniper_info else "TBD",
-                "digital_date": vuniper_info.get("digital_date") if vuniper_info else "TBD",
-                "status": determine_downloadable_status(
-                    vuniper_info,
-                    vuniper_info.get("theater_date") if vuniper_info else None,
-                    vuniper_info.get("digital_date") if vuniper_info else None
-                ),
-                "poster_url": "",
-                "overview": "Geen beschrijving beschikbaar.",
-                "movie_id": tmdb_data.get("id") if tmdb_data else None,
-                "vuniper_url": vuniper_info.get("vuniper_url") if vuniper_info else None
-            }
+        seen_ids = []
+        try:
+            movie_requests = iter_pending_movie_requests(conn, request_filter=request_filter)
+            checked_ids = checker.check(checker.iter_due(movie_requests, args.full, seen_ids))
+        except RuntimeError as e:
+            print(f"WebDriver error: {e}")
+            return
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
+            return
+        finally:
+            conn.close()
 
-            if tmdb_data:
-                poster_path = tmdb_data.get("poster_path")
-                if poster_path:
-                    result["poster_url"] = f"https://image.tmdb.org/t/p/w500{poster_path}"
-                result["overview"] = tmdb_data.get("overview", result["overview"])
+        if not seen_ids:
+            print("Geen openstaande filmverzoeken gevonden in de Ombi-database.")
+            return
 
-            results.append(result)
-    finally:
-        driver.quit()
+        # Met filters is alleen een deel opgehaald; de rest is dan niet verdwenen
+        if request_filter.is_default():
+            checker.state.forget_missing(seen_ids)
+        print(f"\n{len(seen_ids)} films gevonden, {len(checked_ids)} gecontroleerd, "
+              f"{len(seen_ids) - len(checked_ids)} ongewijzigd overgeslagen.")
 
-    # Toon CLI overzicht
-    print("\nResultaten:")
-    for r in results:
-        print(f"{r['title']}: {r['status']} - Digital: {r['digital_date']}")
+        # Overgeslagen verzoeken komen met hun vorige resultaat achter de gecontroleerde
+        if writers:
+            checked_set = set(checked_ids)
+            for request_id in seen_ids:
+                if request_id in checked_set:
+                    continue
+                previous = checker.state.previous_result(request_id)
+                if previous:
+                    for writer in writers:
+                        writer.write(request_id, previous, checked=False)
 
-    # Optioneel HTML rapport
-    global movie_results
-    movie_results = results
-    if args.output_html:
-        html = generate_html_content()
-        try:
-            with open(args.output_html, "w", encoding="utf-8") as f:
-                f.write(html)
-            print(f"\n✅ HTML rapport opgeslagen als: {args.output_html}")
-        except Exception as e:
-            print(f"❌ Fout bij opslaan van HTML: {e}")
+        report_results(checker.state, seen_ids, args.output_html, checker.report_cache, checker.poster_cache)
+    finally:
+        checker.close()
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
@@ -1681,12 +1336,15 @@ if __name__ == "__main__":
         controls_frame = tk.Frame(window)
         controls_frame.pack(pady=10)
 
-        tk.Button(controls_frame, text="Check Availability", command=check_movies).pack(side=tk.LEFT, padx=(0, 20))
+        check_button = tk.Button(controls_frame, text="Check Availability", command=check_movies)
+        check_button.pack(side=tk.LEFT, padx=(0, 5))
+        cancel_button = tk.Button(controls_frame, text="Cancel", command=cancel_check, state=tk.DISABLED)
+        cancel_button.pack(side=tk.LEFT, padx=(0, 20))
 
         tk.Label(controls_frame, text="Sort by:").pack(side=tk.LEFT, padx=(0, 5))
         sort_var = tk.StringVar(value="Title")
         sort_dropdown = ttk.Combobox(controls_frame, textvariable=sort_var, 
-                                    values=["Title", "Theater Date", "Digital Date", "Downloadable"], 
+                                    values=["Title", "Theater Date", "Digital Date", "Status"], 
                                     state="readonly", width=15)
         sort_dropdown.pack(side=tk.LEFT, padx=(0, 10))
         tk.Button(controls_frame, text="Sort", command=sort_results).pack(side=tk.LEFT, padx=(0, 20))
@@ -1699,8 +1357,18 @@ if __name__ == "__main__":
         tk.Button(controls_frame, text="Settings", command=open_settings_window, 
                 bg="#6c757d", fg="white", font=("Arial", 9, "bold")).pack(side=tk.LEFT)
 
+        # Progress of the background check
+        progress_frame = tk.Frame(window)
+        progress_frame.pack(fill=tk.X, padx=10)
+        progress_bar = ttk.Progressbar(progress_frame, mode="determinate")
+        progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        progress_var = tk.StringVar(value="")
+        tk.Label(progress_frame, textvariable=progress_var, width=60, anchor='w').pack(side=tk.LEFT, padx=(10, 0))
+        check_worker = CheckWorker(window, handle_check_event)
+
         tk.Label(window, text="Results:").pack(anchor='w', padx=10)
         output_text = scrolledtext.ScrolledText(window, height=15, width=110, state=tk.DISABLED)
         output_text.pack(padx=10, pady=5)
+        bind_result_header()
 
         window.mainloop()
\ No newline at end of file
@@ -0,0 +1,151 @@
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Pillow is optional: without it posters are stored as downloaded
+try:
+    from PIL import Image, features
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# Report cards are about 300px wide, TMDb serves this size directly (w500 is the full-size card poster)
+POSTER_SIZE = "w342"
+POSTER_WIDTH = 342
+POSTER_QUALITY = 80
+# TMDb poster files never change under the same path, so they are only revalidated now and then
+POSTER_RECHECK = 30 * 24 * 3600
+
+TMDB_IMAGE_SIZE = re.compile(r'(image\.tmdb\.org/t/p/)[^/]+/')
+
+def poster_source_url(url):
+    """The TMDb poster in the size the report needs."""
+    return TMDB_IMAGE_SIZE.sub(rf'\g<1>{POSTER_SIZE}/', url, count=1)
+
+def downscale(content):
+    """(bytes, extension) of a poster shrunk to POSTER_WIDTH as WebP (or JPEG), or None without Pillow."""
+    if not HAS_PIL:
+        return None
+    image = Image.open(io.BytesIO(content))
+    image.thumbnail((POSTER_WIDTH, POSTER_WIDTH * 3))
+    output = io.BytesIO()
+    if features.check("webp"):
+        image.save(output, "WEBP", quality=POSTER_QUALITY)
+        return output.getvalue(), ".webp"
+    image.convert("RGB").save(output, "JPEG", quality=POSTER_QUALITY, optimize=True)
+    return output.getvalue(), ".jpg"
+
+class PosterCache:
+    """Local copies of the report posters in one directory, so a report view does not hotlink TMDb.
+
+    Each poster is downloaded once and stored downscaled. index.json remembers the file,
+    ETag and Last-Modified per URL, so revalidation is a conditional request that
+    normally answers 304 without a body.
+    """
+
+    def __init__(self, directory, timeout=10, workers=4, recheck_after=POSTER_RECHECK):
+        self.directory = directory
+        self.timeout = timeout
+        self.workers = workers
+        self.recheck_after = recheck_after
+        self.index_path = os.path.join(directory, "index.json")
+        self.lock = threading.Lock()
+        self.downloaded = 0
+        self.not_modified = 0
+        self.errors = 0
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=workers))
+
+        os.makedirs(directory, exist_ok=True)
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                self.index = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def fetch(self, url):
+        """Make sure the poster of url is on disk; returns its file name or None."""
+        with self.lock:
+            entry = dict(self.index.get(url) or {})
+        path = os.path.join(self.directory, entry['file']) if entry.get('file') else None
+        if path and os.path.exists(path) and time.time() - entry.get('checked_at', 0) < self.recheck_after:
+            return entry['file']
+
+        headers = {}
+        if path and os.path.exists(path):
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        try:
+            response = self.session.get(poster_source_url(url), headers=headers, timeout=self.timeout)
+            if response.status_code == 304:
+                with self.lock:
+                    self.not_modified += 1
+            elif response.status_code == 200:
+                content, extension = downscale(response.content) or (response.content, ".jpg")
+                name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:20] + extension
+                with open(os.path.join(self.directory, name), "wb") as f:
+                    f.write(content)
+                entry = {
+                    'file': name,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                }
+                with self.lock:
+                    self.downloaded += 1
+            else:
+                raise requests.RequestException(f"HTTP {response.status_code}")
+        except (requests.RequestException, OSError) as e:
+            with self.lock:
+                self.errors += 1
+            print(f"Poster download failed for {url}: {e}")
+            return entry.get('file') if path and os.path.exists(path) else None
+
+        entry['checked_at'] = time.time()
+        with self.lock:
+            self.index[url] = entry
+        return entry['file']
+
+    def localize(self, results, report_path):
+        """Copies of the results whose poster_url points to the local poster, relative to report_path.
+
+        Posters that could not be downloaded keep their TMDb URL.
+        """
+        urls = list({movie['poster_url'] for movie in results if movie.get('poster_url')})
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            files = dict(zip(urls, executor.map(self.fetch, urls)))
+        self.save_index()
+
+        report_dir = os.path.dirname(os.path.abspath(report_path))
+        prefix = os.path.relpath(os.path.abspath(self.directory), report_dir).replace(os.sep, "/")
+        localized = []
+        for movie in results:
+            name = files.get(movie.get('poster_url'))
+            if name:
+                movie = dict(movie, poster_url=f"{urllib.parse.quote(prefix)}/{name}")
+            localized.append(movie)
+        return localized
+
+    def save_index(self):
+        tmp_path = f"{self.index_path}.tmp"
+        with self.lock:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def stats(self):
+        return f"{self.downloaded} downloaded, {self.not_modified} not modified, {self.errors} errors"
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,58 @@
+import csv
+import json
+import sys
+
+# Columns of the machine-readable outputs, in CSV order
+FIELDS = ["request_id", "title", "status", "theater_date", "digital_date", "source", "checked",
+          "movie_id", "vuniper_url", "poster_url", "overview", "elapsed"]
+
+FORMATS = ("jsonl", "json", "csv")
+
+class ResultWriter:
+    """Writes results to a file (or stdout with "-") one by one, as soon as each one is known.
+
+    jsonl: one JSON object per line, flushed per line so other programs can follow along.
+    json:  one JSON array, written element by element.
+    csv:   a header and one row per result.
+    """
+
+    def __init__(self, path, fmt):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown output format: {fmt}")
+        self.path = path
+        self.fmt = fmt
+        self.count = 0
+        if path == "-":
+            self.stream = sys.stdout
+            self.owns_stream = False
+        else:
+            self.stream = open(path, "w", encoding="utf-8", newline="" if fmt == "csv" else None)
+            self.owns_stream = True
+
+        if fmt == "csv":
+            self.csv_writer = csv.DictWriter(self.stream, fieldnames=FIELDS, extrasaction="ignore")
+            self.csv_writer.writeheader()
+        elif fmt == "json":
+            self.stream.write("[")
+        self.stream.flush()
+
+    def write(self, request_id, result, checked=True):
+        record = {field: result.get(field) for field in FIELDS}
+        record["request_id"] = request_id
+        record["checked"] = checked
+
+        if self.fmt == "jsonl":
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        elif self.fmt == "json":
+            self.stream.write(("," if self.count else "") + "\n  " + json.dumps(record, ensure_ascii=False))
+        else:
+            self.csv_writer.writerow(record)
+        self.stream.flush()
+        self.count += 1
+
+    def close(self):
+        if self.fmt == "json":
+            self.stream.write("\n]\n")
+        self.stream.flush()
+        if self.owns_stream:
+            self.stream.close()
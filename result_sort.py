@@ -0,0 +1,58 @@
+from datetime import date
+from operator import itemgetter
+
+# Best first: what can be downloaded now, then what is coming
+STATUS_RANK = {"Yes": 1, "Soon": 2, "TBD": 3, "No": 4}
+UNKNOWN_STATUS_RANK = 5
+
+# TBD, "-" and missing dates sort after every real date
+UNKNOWN_DATE = date.max.toordinal()
+
+# Column name -> key of the precomputed sort value in a result
+SORT_KEYS = {
+    "Title": "sort_title",
+    "Theater Date": "sort_theater_date",
+    "Digital Date": "sort_digital_date",
+    "Status": "sort_status",
+}
+
+def date_ordinal(value):
+    """Ordinal of a YYYY-MM-DD date, UNKNOWN_DATE for anything else."""
+    try:
+        return date.fromisoformat(value).toordinal()
+    except (TypeError, ValueError):
+        return UNKNOWN_DATE
+
+def add_sort_keys(result):
+    """Store the sort values on a result once, so sorting never parses anything again."""
+    result["sort_title"] = (result.get("title") or "").lower()
+    result["sort_theater_date"] = date_ordinal(result.get("theater_date"))
+    result["sort_digital_date"] = date_ordinal(result.get("digital_date"))
+    result["sort_status"] = STATUS_RANK.get(result.get("status"), UNKNOWN_STATUS_RANK)
+    return result
+
+def choose_sort_column(sort_columns, column, toggle=True, max_columns=3):
+    """Sort order after picking column: it becomes the first key, the earlier ones break ties.
+
+    sort_columns is a list of (column, descending). Picking the first column again
+    reverses it when toggle is set.
+    """
+    if sort_columns and sort_columns[0][0] == column:
+        descending = not sort_columns[0][1] if toggle else sort_columns[0][1]
+        return [(column, descending)] + sort_columns[1:]
+    others = [(name, descending) for name, descending in sort_columns if name != column]
+    return ([(column, False)] + others)[:max_columns]
+
+def sort_results_by(results, sort_columns):
+    """Stable sort on several (column, descending) keys, the first one is the primary key."""
+    ordered = list(results)
+    # Sorting from the last key to the first keeps the earlier keys in charge (sorts are stable)
+    for column, descending in reversed(sort_columns):
+        ordered.sort(key=itemgetter(SORT_KEYS[column]), reverse=descending)
+    return ordered
+
+def sort_marker(sort_columns, column):
+    """Arrow to show next to a column header when it is the primary sort key."""
+    if sort_columns and sort_columns[0][0] == column:
+        return " ▼" if sort_columns[0][1] else " ▲"
+    return ""
@@ -0,0 +1,88 @@
+import sqlite3
+import time
+
+# Latest result per request, for dashboards and bots:
+#   SELECT * FROM latest_results WHERE status = 'Yes'
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    mode TEXT,
+    checked INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    request_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    theater_date TEXT,
+    digital_date TEXT,
+    status TEXT,
+    source TEXT,
+    tmdb_id INTEGER,
+    vuniper_url TEXT,
+    checked_at REAL NOT NULL,
+    elapsed REAL,
+    PRIMARY KEY (run_id, request_id)
+);
+CREATE INDEX IF NOT EXISTS idx_results_request_run ON results (request_id, run_id DESC);
+CREATE INDEX IF NOT EXISTS idx_results_status ON results (status, run_id);
+CREATE VIEW IF NOT EXISTS latest_results AS
+    SELECT r.* FROM results r
+    WHERE r.run_id = (SELECT MAX(run_id) FROM results WHERE request_id = r.request_id);
+"""
+
+class ResultStore:
+    """History of check results, one row per checked request per run, for other tools to read."""
+
+    def __init__(self, db_path="ombicheck_results.db"):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path)
+        # Readers (dashboards, bots) never block the checker and see committed runs only
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def start_run(self, mode=None):
+        cursor = self.conn.execute("INSERT INTO runs (started_at, mode) VALUES (?, ?)", (time.time(), mode))
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def record(self, run_id, request, result):
+        """Store the result of one request."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO results "
+            "(run_id, request_id, title, theater_date, digital_date, status, source, tmdb_id, vuniper_url, "
+            "checked_at, elapsed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id,
+                request.request_id,
+                request.title,
+                result.get('theater_date'),
+                result.get('digital_date'),
+                result.get('status'),
+                result.get('source'),
+                result.get('movie_id'),
+                result.get('vuniper_url'),
+                time.time(),
+                result.get('elapsed'),
+            )
+        )
+        self.conn.commit()
+
+    def finish_run(self, run_id, checked):
+        self.conn.execute("UPDATE runs SET finished_at = ?, checked = ? WHERE run_id = ?",
+                          (time.time(), checked, run_id))
+        self.conn.commit()
+
+    def latest(self, request_id):
+        """Most recent stored result of a request as a dict, or None."""
+        cursor = self.conn.execute(
+            "SELECT * FROM results WHERE request_id = ? ORDER BY run_id DESC LIMIT 1", (request_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return dict(zip([column[0] for column in cursor.description], row))
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,89 @@
+class TreeviewResults:
+    """Keeps a ttk.Treeview in sync with result dicts without rebuilding it.
+
+    Rows are keyed by row_key(result), an id per result such as the input line it came
+    from (titles are not unique: remakes share them). A new result for a key updates that
+    row in place (only when its values changed), sorting moves the existing items instead
+    of recreating them, and items are only created once they scroll into view,
+    page_size rows at a time.
+    """
+
+    def __init__(self, tree, scrollbar, row_values, row_key, page_size=200):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.row_values = row_values
+        self.row_key = row_key
+        self.page_size = page_size
+        self.limit = page_size   # how many rows of order may be attached
+        self.results = {}        # key -> result
+        self.order = []          # keys in display order
+        self.iids = {}           # key -> Treeview item, once created
+        self.values = {}         # key -> values shown in its item
+        self.attached = set()    # keys whose item is in the tree right now
+        tree.configure(yscrollcommand=self.on_scroll)
+
+    def on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        # Close to the bottom: render the next page
+        if float(last) > 0.9 and self.limit < len(self.order):
+            self.render_more()
+
+    def item(self, key):
+        """The Treeview item of a key, created (at the end) if needed."""
+        iid = self.iids.get(key)
+        values = self.row_values(self.results[key])
+        if iid is None:
+            iid = self.iids[key] = self.tree.insert('', 'end', values=values)
+            self.values[key] = values
+            self.attached.add(key)
+        elif self.values[key] != values:
+            self.tree.item(iid, values=values)
+            self.values[key] = values
+        return iid
+
+    def upsert(self, result):
+        """Add a result, or update the row of a key that is already shown."""
+        key = self.row_key(result)
+        is_new = key not in self.results
+        self.results[key] = result
+        if is_new:
+            self.order.append(key)
+            if len(self.order) <= self.limit:
+                self.tree.move(self.item(key), '', 'end')
+        elif key in self.iids:
+            self.item(key)
+
+    def set_order(self, keys):
+        """Show the rows in this order, reusing the existing items."""
+        self.order = [key for key in keys if key in self.results]
+        visible = self.order[:self.limit]
+        for index, key in enumerate(visible):
+            self.tree.move(self.item(key), '', index)
+        for key in self.attached - set(visible):
+            self.tree.detach(self.iids[key])
+        self.attached = set(visible)
+
+    def render_more(self):
+        start = min(self.limit, len(self.order))
+        self.limit += self.page_size
+        for key in self.order[start:self.limit]:
+            self.tree.move(self.item(key), '', 'end')
+            self.attached.add(key)
+
+    def show(self, results):
+        """Show exactly these results, in this order."""
+        for result in results:
+            self.upsert(result)
+        self.keep_only({self.row_key(result) for result in results})
+        self.set_order([self.row_key(result) for result in results])
+
+    def keep_only(self, keys):
+        """Remove the rows of all other keys."""
+        for key in [key for key in self.results if key not in keys]:
+            iid = self.iids.pop(key, None)
+            if iid is not None:
+                self.tree.delete(iid)
+            del self.results[key]
+            self.values.pop(key, None)
+            self.attached.discard(key)
+        self.order = [key for key in self.order if key in keys]
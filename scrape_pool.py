@@ -0,0 +1,107 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+class RateLimiter:
+    """Thread-safe limiter spacing requests to a host at most `rate` per second."""
+
+    def __init__(self, rate=2.0):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_time = 0.0
+
+    def wait(self):
+        """Block until the caller is allowed to send the next request."""
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_time - now
+            self.next_time = max(now, self.next_time) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+class DriverPool:
+    """Pool of Selenium drivers, created lazily up to `size` and shared by worker threads."""
+
+    def __init__(self, factory, size=1):
+        self.factory = factory
+        self.size = max(1, size)
+        self.idle = queue.Queue()
+        self.drivers = []
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Get an idle driver, start a new one if the pool is not full yet, otherwise wait."""
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self.lock:
+            create = len(self.drivers) < self.size
+            if create:
+                self.drivers.append(None)  # reserve the slot
+
+        if not create:
+            return self.idle.get()
+
+        driver = self.factory()
+        with self.lock:
+            self.drivers.remove(None)
+            if driver:
+                self.drivers.append(driver)
+        if not driver:
+            raise RuntimeError("Failed to initialize Chrome WebDriver")
+        return driver
+
+    def release(self, driver):
+        self.idle.put(driver)
+
+    def close(self):
+        with self.lock:
+            drivers, self.drivers = [d for d in self.drivers if d], []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Error closing WebDriver: {str(e)}")
+
+class PooledDriver:
+    """Driver handle that only takes a driver from the pool when it is actually used."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.driver = None
+
+    def __getattr__(self, name):
+        if self.driver is None:
+            self.driver = self.pool.acquire()
+        return getattr(self.driver, name)
+
+    def release(self):
+        if self.driver is not None:
+            self.pool.release(self.driver)
+            self.driver = None
+
+def map_in_order(func, items, workers=1):
+    """Run func over items with a thread pool and yield the results in input order.
+
+    items may be a generator: only a few items per worker are taken ahead, so a
+    streaming source is never read into memory as a whole (unlike Executor.map).
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,32 @@
+from custom_dates import CustomDates, parse_custom_dates_line
+
+def make_dates(*lines):
+    custom_dates = CustomDates()
+    for line in lines:
+        custom_dates.add(*parse_custom_dates_line(line))
+    return custom_dates
+
+def test_filler_words_do_not_block_a_match():
+    custom_dates = make_dates("F1 July 15, 2025")
+    match = custom_dates.best_match("F1 The Movie")
+    assert match is not None
+    assert match[:2] == ("F1", "2025-07-15")
+
+def test_sequel_does_not_match_the_first_movie():
+    custom_dates = make_dates("Jurassic World August 5", "Superman August 26")
+    assert custom_dates.best_match("Jurassic World Dominion") is None
+    assert custom_dates.best_match("Superman II") is None
+
+def test_every_entry_word_has_to_be_in_the_title():
+    custom_dates = make_dates("Jurassic World: Rebirth August 5")
+    assert custom_dates.best_match("Jurassic World") is None
+    assert custom_dates.best_match("Jurassic World Rebirth")[:2] == ("Jurassic World: Rebirth", "2025-08-05")
+
+def test_most_specific_entry_wins():
+    custom_dates = make_dates("Jurassic World August 5", "Jurassic World: Rebirth August 12")
+    assert custom_dates.best_match("The Jurassic World Rebirth")[1] == "2025-08-12"
+
+def test_exact_variations():
+    custom_dates = make_dates("The New Era Movie July 26, 2025")
+    assert custom_dates.exact("New Era Movie") == "2025-07-26"
+    assert custom_dates.exact("Another Movie") is None
@@ -0,0 +1,36 @@
+import pytest
+
+from dateparse import parse_date, parse_date_uncached
+
+# Outputs of the old one-format-after-another parser for every format it handled
+CASES = [
+    ("Jul 24, 2025", None, "2025-07-24"),
+    ("July 24, 2025", None, "2025-07-24"),
+    ("24 Jul 2025", None, "2025-07-24"),
+    ("2025-01-15", None, "2025-01-15"),
+    ("1/15/2025", None, "2025-01-15"),
+    ("15/1/2025", None, None),
+    ("15-01-2025", None, "2025-01-15"),
+    ("Jan 2025", None, "2025-01-01"),
+    ("July 24 2025", None, None),
+    ("2025", None, "2025-01-01"),
+    ("TBD", None, None),
+    ("", None, None),
+    (None, None, None),
+    ("01/02/2025", None, "2025-01-02"),
+    ("01/02/2025", True, "2025-02-01"),
+    ("01/02/2025", False, "2025-01-02"),
+    ("01-02-2025", None, "2025-02-01"),
+    ("01-02-2025", True, "2025-02-01"),
+    ("01-02-2025", False, "2025-01-02"),
+]
+
+@pytest.mark.parametrize("date_str, day_first, expected", CASES)
+def test_parse_date_uncached(date_str, day_first, expected):
+    assert parse_date_uncached(date_str, day_first=day_first) == expected
+
+@pytest.mark.parametrize("date_str, day_first, expected", CASES)
+def test_parse_date_matches_uncached(date_str, day_first, expected):
+    assert parse_date(date_str, day_first) == expected
+    # A second call comes from the cache and must give the same answer
+    assert parse_date(date_str, day_first) == expected
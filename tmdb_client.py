@@ -0,0 +1,168 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from scrape_pool import RateLimiter
+
+TMDB_API_URL = "https://api.themoviedb.org/3"
+# Stay below TMDb's request rate limit
+TMDB_REQUESTS_PER_SECOND = 40
+
+# Status codes worth retrying: rate limited or a temporary server problem
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+class TMDbClient:
+    """TMDb API client with one keep-alive session, timeouts, retries and latency counters."""
+
+    def __init__(self, token, timeout=10, max_retries=3, backoff=0.5, pool_size=4,
+                 rate=TMDB_REQUESTS_PER_SECOND):
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=pool_size))
+        self.set_token(token)
+        self.rate_limiter = RateLimiter(rate)
+
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    def set_token(self, token):
+        self.session.headers.update({
+            "Authorization": f"Bearer {token}",
+            "accept": "application/json"
+        })
+
+    def retry_delay(self, response, attempt):
+        """Seconds to wait before the next attempt, honoring Retry-After when TMDb sends it."""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        return self.backoff * (2 ** attempt)
+
+    def get(self, path, params=None):
+        """GET an API path and return the decoded JSON, or None after all retries failed."""
+        url = f"{TMDB_API_URL}{path}"
+        for attempt in range(self.max_retries + 1):
+            response = None
+            self.rate_limiter.wait()
+            start = time.monotonic()
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except requests.RequestException as e:
+                error = str(e)
+            else:
+                error = f"HTTP {response.status_code}"
+            finally:
+                self.record(time.monotonic() - start)
+
+            if response is not None and response.status_code == 200:
+                return response.json()
+            if response is not None and response.status_code not in RETRY_STATUS:
+                break
+            if attempt < self.max_retries:
+                with self.lock:
+                    self.retries += 1
+                time.sleep(self.retry_delay(response, attempt))
+
+        with self.lock:
+            self.errors += 1
+        print(f"TMDb request failed for {path}: {error}")
+        return None
+
+    def record(self, elapsed):
+        with self.lock:
+            self.requests += 1
+            self.total_time += elapsed
+            self.max_time = max(self.max_time, elapsed)
+
+    def search_movie(self, title, language=None):
+        """Return the first search result for a title, or None."""
+        params = {"query": title}
+        if language:
+            params["language"] = language
+        data = self.get("/search/movie", params)
+        if data and data.get("results"):
+            return data["results"][0]
+        return None
+
+    def get_movie(self, tmdb_id, language=None, append=("release_dates",)):
+        """Fetch a movie by TMDb id, with extra data (release dates) in the same request."""
+        params = {}
+        if language:
+            params["language"] = language
+        if append:
+            params["append_to_response"] = ",".join(append)
+        return self.get(f"/movie/{tmdb_id}", params)
+
+    def stats(self):
+        """Short summary of the request latency counters."""
+        with self.lock:
+            average = self.total_time / self.requests if self.requests else 0.0
+            return (f"{self.requests} requests, {self.retries} retries, {self.errors} errors, "
+                    f"avg {average * 1000:.0f} ms, max {self.max_time * 1000:.0f} ms, "
+                    f"total {self.total_time:.1f}s")
+
+    def close(self):
+        self.session.close()
+
+def digital_release_date(movie):
+    """Earliest digital (type 4) release date from an appended release_dates block, as YYYY-MM-DD."""
+    dates = []
+    for country in (movie or {}).get("release_dates", {}).get("results", []):
+        for release in country.get("release_dates", []):
+            if release.get("type") == 4 and release.get("release_date"):
+                dates.append(release["release_date"][:10])
+    return min(dates) if dates else None
+
+class TMDbPrefetcher:
+    """Run TMDb lookups for a whole batch in background threads, joined by TMDb id or title later."""
+
+    def __init__(self, client, language=None, workers=4):
+        self.client = client
+        self.language = language
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.futures = {}
+
+    @staticmethod
+    def key(title, tmdb_id=None):
+        # Remakes share a title, so a known id is the only safe key
+        return ("id", tmdb_id) if tmdb_id else ("title", title)
+
+    def submit(self, title, tmdb_id=None):
+        """Start the lookup of a movie: fetched directly by its TMDb id when known, searched by title otherwise."""
+        key = self.key(title, tmdb_id)
+        if key in self.futures:
+            return
+        if tmdb_id:
+            self.futures[key] = self.executor.submit(self.client.get_movie, tmdb_id, self.language)
+        else:
+            self.futures[key] = self.executor.submit(self.client.search_movie, title, self.language)
+
+    def get(self, title, tmdb_id=None):
+        """Wait for (or start) the lookup of a movie and return its result.
+
+        The lookup is forgotten once read, so a long run does not keep every result.
+        """
+        self.submit(title, tmdb_id)
+        try:
+            return self.futures.pop(self.key(title, tmdb_id)).result()
+        except Exception as e:
+            print(f"TMDb search error for '{title}': {str(e)}")
+            return None
+
+    def close(self):
+        # Lookups that did not start yet are not needed anymore (cancel_futures needs Python 3.9)
+        for future in self.futures.values():
+            future.cancel()
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,113 @@
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# How long a cached Vuniper result stays valid, per status (in seconds).
+# A "Yes" result cannot change anymore, everything else is re-checked quickly.
+CACHE_TTL = {
+    "Yes": 30 * 24 * 3600,
+    "Soon": 24 * 3600,
+    "TBD": 24 * 3600,
+    "No": 12 * 3600,
+}
+DEFAULT_TTL = 12 * 3600
+
+def normalize_title(title):
+    """Normalize a title for use as cache key (lowercase, no year, no punctuation)."""
+    title = re.sub(r'\s*\(\d{4}\)', '', title or '')
+    title = re.sub(r'[^\w\s]', ' ', title.lower())
+    return ' '.join(title.split())
+
+def refresh_status(info):
+    """Re-evaluate the status of a cached result, a 'Soon' date may have passed since."""
+    if info and info.get('status') == 'Soon' and info.get('digital_date'):
+        try:
+            if datetime.strptime(info['digital_date'], "%Y-%m-%d") <= datetime.now():
+                info['status'] = 'Yes'
+        except ValueError:
+            pass
+    return info
+
+class VuniperCache:
+    """SQLite-backed cache of Vuniper release info keyed by normalized title + year."""
+
+    def __init__(self, db_path="vuniper_cache.db", ttl=None):
+        self.db_path = db_path
+        self.ttl = dict(CACHE_TTL, **(ttl or {}))
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS vuniper_cache (
+                title_key TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                found INTEGER NOT NULL,
+                theater_date TEXT,
+                digital_date TEXT,
+                vuniper_url TEXT,
+                status TEXT,
+                checked_at REAL NOT NULL,
+                PRIMARY KEY (title_key, year)
+            )
+        """)
+        self.conn.commit()
+
+    def lookup(self, title, year=None):
+        """Return (hit, info). info is None for a cached 'not found' result."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT found, theater_date, digital_date, vuniper_url, status, checked_at "
+                "FROM vuniper_cache WHERE title_key = ? AND year = ?",
+                (normalize_title(title), year or 0)
+            ).fetchone()
+
+            if not row or time.time() - row[5] >= self.ttl.get(row[4], DEFAULT_TTL):
+                self.misses += 1
+                return False, None
+            self.hits += 1
+
+        found, theater_date, digital_date, vuniper_url, status, checked_at = row
+        if not found:
+            return True, None
+        info = {
+            'theater_date': theater_date,
+            'digital_date': digital_date,
+            'status': status,
+        }
+        if vuniper_url:
+            info['vuniper_url'] = vuniper_url
+        return True, refresh_status(info)
+
+    def store(self, title, year, info):
+        """Store a Vuniper result (or None when nothing was found)."""
+        info = info or {}
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO vuniper_cache "
+                "(title_key, year, found, theater_date, digital_date, vuniper_url, status, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    normalize_title(title),
+                    year or 0,
+                    1 if info else 0,
+                    info.get('theater_date'),
+                    info.get('digital_date'),
+                    info.get('vuniper_url'),
+                    info.get('status', 'TBD'),
+                    time.time(),
+                )
+            )
+            self.conn.commit()
+
+    def purge_expired(self):
+        """Remove entries older than the longest TTL."""
+        cutoff = time.time() - max(self.ttl.values())
+        with self.lock:
+            self.conn.execute("DELETE FROM vuniper_cache WHERE checked_at < ?", (cutoff,))
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,230 @@
+import re
+import urllib.parse
+from html.parser import HTMLParser
+
+import requests
+from requests.adapters import HTTPAdapter
+
+VUNIPER_BASE_URL = "https://vuniper.com"
+VUNIPER_SEARCH_URL = "https://vuniper.com/search?q={query}"
+# Links on the search page that point to a movie page
+MOVIE_LINK_PATTERN = re.compile(r'/movies?/')
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# Same labels the Selenium XPath selectors look for
+THEATER_LABELS = ('Theaters', 'Theater', 'Cinema')
+STREAMING_LABELS = ('Streaming', 'Digital', 'VOD')
+THEATER_ICON = 'Icon of cinema film'
+STREAMING_ICON = 'Streaming icon'
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+             'link', 'meta', 'source', 'track', 'wbr'}
+
+class Node:
+    """Minimal DOM node, just enough to mimic the XPath lookups of the Selenium scraper."""
+    __slots__ = ('tag', 'attrs', 'parent', 'children')
+
+    def __init__(self, tag, attrs=None, parent=None):
+        self.tag = tag
+        self.attrs = dict(attrs or [])
+        self.parent = parent
+        self.children = []
+
+    def text(self):
+        parts = []
+        for child in self.children:
+            parts.append(child if isinstance(child, str) else child.text())
+        return ' '.join(' '.join(parts).split())
+
+    def iter(self, tag=None):
+        for child in self.children:
+            if isinstance(child, Node):
+                if tag is None or child.tag == tag:
+                    yield child
+                yield from child.iter(tag)
+
+    def element_children(self):
+        return [c for c in self.children if isinstance(c, Node)]
+
+class TreeBuilder(HTMLParser):
+    """Build a Node tree from HTML with the standard library parser."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = Node('document')
+        self.current = self.root
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, attrs, self.current)
+        self.current.children.append(node)
+        if tag not in VOID_TAGS:
+            self.current = node
+
+    def handle_startendtag(self, tag, attrs):
+        self.current.children.append(Node(tag, attrs, self.current))
+
+    def handle_endtag(self, tag):
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        if data.strip():
+            self.current.children.append(data)
+
+def parse_html(html):
+    builder = TreeBuilder()
+    builder.feed(html)
+    builder.close()
+    return builder.root
+
+def is_semibold(node):
+    return node.tag == 'span' and node.attrs.get('class') == 'semibold'
+
+def labelled_dates(root, labels):
+    """Texts of semibold spans that precede a sibling span containing one of the labels."""
+    found = []
+    for label in labels:
+        for span in root.iter('span'):
+            if label not in ''.join(c for c in span.children if isinstance(c, str)):
+                continue
+            for sibling in span.parent.element_children():
+                if sibling is span:
+                    break
+                if is_semibold(sibling):
+                    found.append(sibling.text())
+    return found
+
+def icon_dates(root, alt):
+    """Texts of semibold spans in the block around an icon image (img/../..//span)."""
+    found = []
+    for img in root.iter('img'):
+        if img.attrs.get('alt') == alt and img.parent and img.parent.parent:
+            found.extend(span.text() for span in img.parent.parent.iter('span') if is_semibold(span))
+    return found
+
+def score_suggestion(text, base_title, important_words, target_year):
+    """Score a search result like the Selenium scraper does. Returns None for 'no results' entries."""
+    text_lower = text.lower()
+    if any(phrase in text_lower for phrase in ['no results', 'searched movies', 'view results']):
+        return None
+
+    score = 0
+    year_match = re.search(r'(\d{4})', text)
+    suggestion_year = int(year_match.group(1)) if year_match else None
+    if target_year and suggestion_year:
+        if suggestion_year == target_year:
+            score += 1000
+        elif abs(suggestion_year - target_year) <= 1:
+            score += 500
+        else:
+            score -= 200
+    elif not target_year and suggestion_year and suggestion_year < 2020:
+        score += 100
+
+    if important_words:
+        score += 50 * sum(1 for word in important_words if word.lower() in text_lower)
+
+    if re.sub(r'\s*\d{4}', '', text).strip().lower() == base_title.lower():
+        score += 200
+    return score
+
+class VuniperHttpClient:
+    """Fetch and parse Vuniper pages over a pooled requests.Session, without a browser."""
+
+    def __init__(self, rate_limiter=None, timeout=10, pool_size=4):
+        self.rate_limiter = rate_limiter
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"})
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+
+    def fetch(self, url):
+        if self.rate_limiter:
+            self.rate_limiter.wait()
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code == 200:
+                return response.text
+            print(f"Vuniper HTTP {response.status_code} for {url}")
+        except requests.RequestException as e:
+            print(f"Vuniper HTTP error for {url}: {str(e)}")
+        return None
+
+    def search(self, term):
+        """Return (text, url) tuples for the movie links on the search results page."""
+        html = self.fetch(VUNIPER_SEARCH_URL.format(query=urllib.parse.quote(term)))
+        if not html:
+            return []
+
+        results = []
+        seen = set()
+        for link in parse_html(html).iter('a'):
+            href = link.attrs.get('href') or ''
+            text = link.text()
+            if not text or not MOVIE_LINK_PATTERN.search(href):
+                continue
+            url = urllib.parse.urljoin(VUNIPER_BASE_URL, href)
+            if url not in seen:
+                seen.add(url)
+                results.append((text, url))
+        return results
+
+    def release_dates(self, url, parse_date):
+        """Return {'theater_date', 'digital_date'} parsed from a movie page, or None if it has no dates."""
+        html = self.fetch(url)
+        if not html:
+            return None
+        root = parse_html(html)
+
+        def first_date(candidates):
+            for text in candidates:
+                date = parse_date(text)
+                if date:
+                    return date
+            return None
+
+        media_lines = [span.text() for div in root.iter('div')
+                       if 'media-viewer-line' in (div.attrs.get('class') or '')
+                       for span in div.iter('span') if is_semibold(span) and '2025' in span.text()]
+        theater_date = first_date(labelled_dates(root, THEATER_LABELS) + icon_dates(root, THEATER_ICON) + media_lines)
+        digital_date = first_date(labelled_dates(root, STREAMING_LABELS) + icon_dates(root, STREAMING_ICON))
+
+        if not digital_date:
+            # Same fallback as the Selenium scraper: any other date on the page
+            for span in root.iter('span'):
+                if is_semibold(span):
+                    date = parse_date(span.text())
+                    if date and date != theater_date:
+                        digital_date = date
+                        break
+
+        if not theater_date and not digital_date:
+            return None
+        return {'theater_date': theater_date, 'digital_date': digital_date}
+
+    def find_release_info(self, search_variations, base_title, important_words, target_year, parse_date):
+        """Try the search variations in order. Returns (dates, vuniper_url) or (None, None)."""
+        for search_term in search_variations:
+            scored = []
+            for text, url in self.search(search_term):
+                score = score_suggestion(text, base_title, important_words, target_year)
+                if score is not None:
+                    scored.append((score, text, url))
+            if not scored:
+                print(f"HTTP: no results for '{search_term}'")
+                continue
+
+            score, text, url = max(scored, key=lambda s: s[0])
+            print(f"HTTP: selected '{text}' (score: {score}) -> {url}")
+            dates = self.release_dates(url, parse_date)
+            if dates:
+                return dates, url
+        return None, None
+
+    def close(self):
+        self.session.close()